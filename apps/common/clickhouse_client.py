@@ -1,6 +1,7 @@
 from __future__ import annotations
 import os
-from typing import Any, Iterable
+import threading
+from typing import Any, Iterable, Optional
 from urllib.parse import urlparse
 import pandas as pd
 import clickhouse_connect
@@ -10,6 +11,15 @@ CLICKHOUSE_USER = os.getenv("CLICKHOUSE_USER", "default")
 CLICKHOUSE_PASSWORD = os.getenv("CLICKHOUSE_PASSWORD", "")
 CLICKHOUSE_DB = os.getenv("CLICKHOUSE_DB", "fxai")
 
+# For small, frequent inserts: the server buffers them and flushes larger parts,
+# and the client does not wait for the flush
+ASYNC_INSERT_SETTINGS = {
+    "async_insert": 1,
+    "wait_for_async_insert": 0,
+    "async_insert_busy_timeout_ms": 1000,
+    "async_insert_max_data_size": 10_000_000,
+}
+
 def _host_port_from_url(url: str) -> tuple[str, int]:
     parsed = urlparse(url)
     host = parsed.hostname or "localhost"
@@ -17,27 +27,48 @@ def _host_port_from_url(url: str) -> tuple[str, int]:
     port = parsed.port or (443 if parsed.scheme == "https" else 8123)
     return host, port
 
+# One client per thread (clients are not safe for concurrent use), kept for the process
+# lifetime so queries and inserts reuse its keep-alive HTTP connections
+_local = threading.local()
+
 def get_client():
+    cli = getattr(_local, "client", None)
+    # a forked worker must not share the parent's sockets
+    if cli is not None and _local.pid == os.getpid():
+        return cli
     host, port = _host_port_from_url(CLICKHOUSE_URL)
-    return clickhouse_connect.get_client(
+    cli = clickhouse_connect.get_client(
         host=host,
         port=port,
         username=CLICKHOUSE_USER,
         password=CLICKHOUSE_PASSWORD,
         database=CLICKHOUSE_DB,
     )
+    _local.client, _local.pid = cli, os.getpid()
+    return cli
 
 def exec_sql(sql: str) -> None:
     cli = get_client()
     cli.command(sql)
 
-def query_df(sql: str) -> pd.DataFrame:
+def query_df(sql: str, parameters: Optional[dict[str, Any]] = None) -> pd.DataFrame:
+    # `parameters` are bound server-side to {name:Type} placeholders in `sql`
+    cli = get_client()
+    return cli.query_df(sql, parameters=parameters)
+
+def query_rows(sql: str, parameters: Optional[dict[str, Any]] = None) -> list[tuple]:
+    # plain tuples, for small results that don't need a DataFrame
+    cli = get_client()
+    return cli.query(sql, parameters=parameters).result_rows
+
+def query_scalar(sql: str, parameters: Optional[dict[str, Any]] = None) -> int:
     cli = get_client()
-    return cli.query_df(sql)
+    return int(cli.command(sql, parameters=parameters))
 
-def insert_rows(table: str, rows: Iterable[tuple[Any, ...]], columns: list[str]) -> None:
+def insert_rows(table: str, rows: Iterable[tuple[Any, ...]], columns: list[str],
+                settings: Optional[dict[str, Any]] = None) -> None:
     cli = get_client()
-    cli.insert(table, rows, column_names=columns)
+    cli.insert(table, rows, column_names=columns, settings=settings)
 
 def insert_df(table: str, df: pd.DataFrame) -> None:
     cli = get_client()
@@ -10,6 +10,7 @@ from __future__ import annotations
 import os
 import json
 import time
+import asyncio
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
@@ -25,6 +26,78 @@ LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4-turbo")
 LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.3"))
 LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "1000"))
 
+# Static prompt text goes first and is never formatted, so every request shares an
+# identical prefix that providers can serve from their prompt caches; only the
+# article (see _article_prompt) varies, and it comes last.
+SENTIMENT_SYSTEM_PROMPT = """You are a financial analyst specializing in foreign exchange markets.
+Your task is to analyze news articles and provide precise sentiment analysis for currency trading decisions.
+
+Focus on:
+1. How the news affects currency values (USD, INR, EUR, GBP, JPY)
+2. Market impact and urgency
+3. Key entities and topics
+4. Clear, actionable insights
+
+Be objective, precise, and consistent in your analysis."""
+
+SENTIMENT_SCHEMA_INSTRUCTIONS = """**Required Analysis:**
+Provide your analysis in JSON format with the following fields:
+
+1. **sentiment_overall**: Overall market sentiment (-1 to +1, where -1 is very bearish, +1 is very bullish)
+2. **sentiment_usd**: USD-specific sentiment (-1 to +1)
+3. **sentiment_inr**: INR-specific sentiment (-1 to +1)
+4. **sentiment_eur**: EUR-specific sentiment (-1 to +1)
+5. **sentiment_gbp**: GBP-specific sentiment (-1 to +1)
+6. **sentiment_jpy**: JPY-specific sentiment (-1 to +1)
+7. **impact_score**: Predicted market impact (0-10, where 10 is highly market-moving)
+8. **urgency**: Time sensitivity (low, medium, high, critical)
+9. **confidence**: Your confidence in this analysis (0-1)
+10. **currencies**: List of mentioned currencies (e.g., ["USD", "INR"])
+11. **countries**: List of mentioned countries (e.g., ["US", "India"])
+12. **institutions**: List of mentioned institutions (e.g., ["Federal Reserve", "RBI"])
+13. **topics**: List of key topics (e.g., ["interest_rates", "inflation", "trade"])
+14. **explanation**: Brief explanation (2-3 sentences) of your analysis
+15. **key_phrases**: Important phrases from the article (list of strings)
+
+**Response Format:**
+{
+  "sentiment_overall": <float>,
+  "sentiment_usd": <float>,
+  "sentiment_inr": <float>,
+  "sentiment_eur": <float>,
+  "sentiment_gbp": <float>,
+  "sentiment_jpy": <float>,
+  "impact_score": <float>,
+  "urgency": "<string>",
+  "confidence": <float>,
+  "currencies": [<strings>],
+  "countries": [<strings>],
+  "institutions": [<strings>],
+  "topics": [<strings>],
+  "explanation": "<string>",
+  "key_phrases": [<strings>]
+}
+
+Respond ONLY with valid JSON. No additional text."""
+
+SENTIMENT_INSTRUCTIONS = SENTIMENT_SYSTEM_PROMPT + "\n\n" + SENTIMENT_SCHEMA_INSTRUCTIONS
+
+
+def _article_prompt(headline: str, content: str, source: str, timestamp: datetime,
+                    max_content_length: int) -> str:
+    """The per-article part of the sentiment prompt, with content truncated."""
+    truncated_content = content[:max_content_length]
+    if len(content) > max_content_length:
+        truncated_content += "... [truncated]"
+    
+    return f"""Analyze the following news article and provide sentiment analysis for FX trading.
+
+**News Article:**
+- Headline: {headline}
+- Source: {source}
+- Published: {timestamp.isoformat()}
+- Content: {truncated_content}"""
+
 
 @dataclass
 class SentimentResult:
@@ -80,6 +153,26 @@ class LLMClient:
         """Analyze sentiment of a news article."""
         raise NotImplementedError
     
+    async def analyze_batch(self, items: List[Dict[str, Any]],
+                            max_concurrency: int = 5) -> List[SentimentResult]:
+        """
+        Analyze several articles concurrently.
+        
+        Args:
+            items: keyword arguments for `analyze_sentiment` (headline, content, source, timestamp)
+            max_concurrency: maximum requests in flight at once
+        
+        Returns:
+            Results in the same order as `items`
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        async def one(item: Dict[str, Any]) -> SentimentResult:
+            async with sem:
+                return await self.analyze_sentiment(**item)
+        
+        return await asyncio.gather(*(one(item) for item in items))
+    
     def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Estimate API cost in USD."""
         raise NotImplementedError
@@ -105,7 +198,14 @@ class OpenAIClient(LLMClient):
         if self._client is None:
             try:
                 import openai
-                self._client = openai.AsyncOpenAI(api_key=self.api_key)
+                # aiohttp transport when available (openai[aiohttp]); it holds up better than
+                # the default httpx one under many concurrent requests
+                http_client = None
+                try:
+                    http_client = openai.DefaultAioHttpClient()
+                except Exception:
+                    pass
+                self._client = openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client)
             except ImportError:
                 raise ImportError("openai package not installed. Run: pip install openai")
         return self._client
@@ -192,74 +292,13 @@ class OpenAIClient(LLMClient):
         return round(cost, 6)
     
     def _get_system_prompt(self) -> str:
-        """Get system prompt for sentiment analysis."""
-        return """You are a financial analyst specializing in foreign exchange markets.
-Your task is to analyze news articles and provide precise sentiment analysis for currency trading decisions.
-
-Focus on:
-1. How the news affects currency values (USD, INR, EUR, GBP, JPY)
-2. Market impact and urgency
-3. Key entities and topics
-4. Clear, actionable insights
-
-Be objective, precise, and consistent in your analysis."""
+        """Get system prompt for sentiment analysis (persona plus output schema)."""
+        return SENTIMENT_INSTRUCTIONS
     
     def _build_sentiment_prompt(self, headline: str, content: str, source: str, 
                                 timestamp: datetime) -> str:
-        """Build the sentiment analysis prompt."""
-        # Truncate content to avoid token limits
-        max_content_length = 2000
-        truncated_content = content[:max_content_length]
-        if len(content) > max_content_length:
-            truncated_content += "... [truncated]"
-        
-        return f"""Analyze the following news article and provide sentiment analysis for FX trading.
-
-**News Article:**
-- Headline: {headline}
-- Source: {source}
-- Published: {timestamp.isoformat()}
-- Content: {truncated_content}
-
-**Required Analysis:**
-Provide your analysis in JSON format with the following fields:
-
-1. **sentiment_overall**: Overall market sentiment (-1 to +1, where -1 is very bearish, +1 is very bullish)
-2. **sentiment_usd**: USD-specific sentiment (-1 to +1)
-3. **sentiment_inr**: INR-specific sentiment (-1 to +1)
-4. **sentiment_eur**: EUR-specific sentiment (-1 to +1)
-5. **sentiment_gbp**: GBP-specific sentiment (-1 to +1)
-6. **sentiment_jpy**: JPY-specific sentiment (-1 to +1)
-7. **impact_score**: Predicted market impact (0-10, where 10 is highly market-moving)
-8. **urgency**: Time sensitivity (low, medium, high, critical)
-9. **confidence**: Your confidence in this analysis (0-1)
-10. **currencies**: List of mentioned currencies (e.g., ["USD", "INR"])
-11. **countries**: List of mentioned countries (e.g., ["US", "India"])
-12. **institutions**: List of mentioned institutions (e.g., ["Federal Reserve", "RBI"])
-13. **topics**: List of key topics (e.g., ["interest_rates", "inflation", "trade"])
-14. **explanation**: Brief explanation (2-3 sentences) of your analysis
-15. **key_phrases**: Important phrases from the article (list of strings)
-
-**Response Format:**
-{{
-  "sentiment_overall": <float>,
-  "sentiment_usd": <float>,
-  "sentiment_inr": <float>,
-  "sentiment_eur": <float>,
-  "sentiment_gbp": <float>,
-  "sentiment_jpy": <float>,
-  "impact_score": <float>,
-  "urgency": "<string>",
-  "confidence": <float>,
-  "currencies": [<strings>],
-  "countries": [<strings>],
-  "institutions": [<strings>],
-  "topics": [<strings>],
-  "explanation": "<string>",
-  "key_phrases": [<strings>]
-}}
-
-Respond ONLY with valid JSON. No additional text."""
+        """Build the sentiment analysis prompt (article only; instructions are in the system prompt)."""
+        return _article_prompt(headline, content, source, timestamp, max_content_length=2000)
 
 
 class AnthropicClient(LLMClient):
@@ -302,6 +341,9 @@ class AnthropicClient(LLMClient):
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
+                # Static instructions first; only the article varies. (No cache_control: at
+                # ~450 tokens this is below Anthropic's minimum cacheable prompt length.)
+                system=SENTIMENT_INSTRUCTIONS,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
@@ -358,10 +400,8 @@ class AnthropicClient(LLMClient):
     
     def _build_sentiment_prompt(self, headline: str, content: str, source: str,
                                 timestamp: datetime) -> str:
-        """Build sentiment analysis prompt for Claude."""
-        # Reuse OpenAI prompt structure
-        openai_client = OpenAIClient()
-        return openai_client._build_sentiment_prompt(headline, content, source, timestamp)
+        """Build sentiment analysis prompt for Claude (article only; instructions are in `system`)."""
+        return _article_prompt(headline, content, source, timestamp, max_content_length=2000)
 
 
 def get_llm_client(provider: str = LLM_PROVIDER, model: str = LLM_MODEL) -> LLMClient:
@@ -21,6 +21,37 @@ OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3")
 OLLAMA_TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT", "30"))
 
+# Built once so every request starts with byte-identical text (lets Ollama reuse its KV cache)
+SENTIMENT_SYSTEM_PROMPT = """You are a financial analyst specializing in foreign exchange markets.
+Analyze news articles and provide precise sentiment analysis for currency trading decisions.
+
+IMPORTANT: Respond ONLY with valid JSON. Do not include any other text or markdown.
+
+Focus on:
+1. Currency value impacts (USD, INR, EUR, GBP, JPY)
+2. Market impact and urgency
+3. Key entities and topics
+4. Clear, actionable insights"""
+
+SENTIMENT_PROMPT_PREFIX = SENTIMENT_SYSTEM_PROMPT + """
+
+Provide sentiment analysis in JSON format with these fields:
+- sentiment_overall: float (-1 to +1, where -1=very bearish, +1=very bullish)
+- sentiment_usd: float (-1 to +1, USD-specific sentiment)
+- sentiment_inr: float (-1 to +1, INR-specific sentiment)
+- sentiment_eur: float (-1 to +1, EUR-specific sentiment)
+- sentiment_gbp: float (-1 to +1, GBP-specific sentiment)
+- sentiment_jpy: float (-1 to +1, JPY-specific sentiment)
+- impact_score: float (0-10, market impact magnitude)
+- urgency: string (low, medium, high, critical)
+- confidence: float (0-1, your confidence in this analysis)
+- currencies: array of strings (mentioned currencies)
+- countries: array of strings (mentioned countries)
+- institutions: array of strings (central banks, governments)
+- topics: array of strings (interest_rates, inflation, trade, etc.)
+- explanation: string (2-3 sentences explaining your analysis)
+- key_phrases: array of strings (important phrases from article)"""
+
 
 class OllamaClient(LLMClient):
     """
@@ -182,16 +213,7 @@ class OllamaClient(LLMClient):
     
     def _get_system_prompt(self) -> str:
         """Get system prompt for sentiment analysis."""
-        return """You are a financial analyst specializing in foreign exchange markets.
-Analyze news articles and provide precise sentiment analysis for currency trading decisions.
-
-IMPORTANT: Respond ONLY with valid JSON. Do not include any other text or markdown.
-
-Focus on:
-1. Currency value impacts (USD, INR, EUR, GBP, JPY)
-2. Market impact and urgency
-3. Key entities and topics
-4. Clear, actionable insights"""
+        return SENTIMENT_SYSTEM_PROMPT
     
     def _build_sentiment_prompt(self, headline: str, content: str, source: str,
                                 timestamp: datetime) -> str:
@@ -202,9 +224,8 @@ Focus on:
         if len(content) > max_content_length:
             truncated_content += "... [truncated]"
         
-        system_prompt = self._get_system_prompt()
-        
-        prompt = f"""{system_prompt}
+        # Static instructions first, article last: consecutive requests share the prefix
+        prompt = f"""{SENTIMENT_PROMPT_PREFIX}
 
 Analyze this news article:
 
@@ -213,23 +234,6 @@ Source: {source}
 Published: {timestamp.isoformat()}
 Content: {truncated_content}
 
-Provide sentiment analysis in JSON format with these fields:
-- sentiment_overall: float (-1 to +1, where -1=very bearish, +1=very bullish)
-- sentiment_usd: float (-1 to +1, USD-specific sentiment)
-- sentiment_inr: float (-1 to +1, INR-specific sentiment)
-- sentiment_eur: float (-1 to +1, EUR-specific sentiment)
-- sentiment_gbp: float (-1 to +1, GBP-specific sentiment)
-- sentiment_jpy: float (-1 to +1, JPY-specific sentiment)
-- impact_score: float (0-10, market impact magnitude)
-- urgency: string (low, medium, high, critical)
-- confidence: float (0-1, your confidence in this analysis)
-- currencies: array of strings (mentioned currencies)
-- countries: array of strings (mentioned countries)
-- institutions: array of strings (central banks, governments)
-- topics: array of strings (interest_rates, inflation, trade, etc.)
-- explanation: string (2-3 sentences explaining your analysis)
-- key_phrases: array of strings (important phrases from article)
-
 Respond with ONLY the JSON object, no other text:"""
         
         return prompt
@@ -0,0 +1,79 @@
+"""
+On-disk response cache for LLM sentiment calls.
+
+Exact-match cache keyed by (model, headline, content), so repeated analyses of
+the same article (e.g. diagnostic scripts re-run during development) skip the
+LLM call and its cost.
+"""
+from __future__ import annotations
+import os
+import json
+import time
+import hashlib
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import structlog
+
+from apps.llm.client import LLMClient, SentimentResult
+
+log = structlog.get_logger()
+
+LLM_RESPONSE_CACHE_DIR = Path(os.getenv("LLM_RESPONSE_CACHE_DIR", ".cache/llm"))
+LLM_RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", "86400"))
+
+
+def cache_key(model: str, headline: str, content: str) -> str:
+    return hashlib.sha256(f"{model}|{headline}|{content}".encode()).hexdigest()
+
+
+def load(key: str, ttl_seconds: int = LLM_RESPONSE_CACHE_TTL_SECONDS) -> Optional[SentimentResult]:
+    """Return the cached result for `key`, or None if missing or older than `ttl_seconds`."""
+    path = LLM_RESPONSE_CACHE_DIR / f"{key}.json"
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if time.time() - cached["ts"] >= ttl_seconds:
+        return None
+    return SentimentResult(**cached["result"])
+
+
+def store(key: str, result: SentimentResult) -> None:
+    try:
+        LLM_RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = LLM_RESPONSE_CACHE_DIR / f"{key}.json"
+        path.write_text(json.dumps({"ts": time.time(), "result": asdict(result)}))
+    except OSError as e:
+        log.warning("llm_response_cache_write_failed", error=str(e))
+
+
+async def cached_analyze_sentiment(client: LLMClient, headline: str, content: str, source: str,
+                                   timestamp: datetime) -> SentimentResult:
+    """
+    `client.analyze_sentiment`, served from the response cache when possible.
+    
+    Args:
+        client: LLM client; its model name is part of the cache key
+        headline, content, source, timestamp: as for `analyze_sentiment`
+    
+    Returns:
+        Cached or freshly computed SentimentResult
+    """
+    key = cache_key(client.model, headline, content)
+    cached = load(key)
+    if cached is not None:
+        log.info("llm_response_cache_hit", model=client.model)
+        return cached
+    
+    result = await client.analyze_sentiment(
+        headline=headline,
+        content=content,
+        source=source,
+        timestamp=timestamp
+    )
+    # Zero-confidence results are error fallbacks; don't pin them for a day
+    if result.confidence > 0:
+        store(key, result)
+    return result
@@ -9,15 +9,71 @@ Includes:
 """
 from __future__ import annotations
 import re
-import json
+import orjson
+import asyncio
+import time
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from typing import List, Optional, Sequence
+import httpx
+import feedparser
 import structlog
+from bs4 import BeautifulSoup
 
-from apps.news.sources import NewsSource, NewsItem
+from apps.news.sources import NewsSource, NewsItem, RecentKeys, get_http_client
 
 log = structlog.get_logger()
 
+UTC = timezone.utc
+
+# Article pages are truncated to 5000 chars of text, so stop reading the body early
+MAX_ARTICLE_BYTES = 200_000
+
+# Rate-limit handling for API sources (Twitter, Trading Economics, Finnhub)
+RETRY_ATTEMPTS = 4
+MAX_RETRY_WAIT_SEC = 60.0
+TWITTER_MIN_REMAINING = 2  # start pacing when this few requests are left in the window
+
+# URLs already turned into NewsItems, shared by all advanced sources so items
+# re-published within a poll or seen in an earlier poll are skipped early
+_SEEN_URLS = RecentKeys(maxsize=4096)
+
+# Precompiled text cleanup patterns
+_WS = re.compile(r"\s+")
+
+# Month abbreviations used on RBI press release listings ("Nov 28, 2025")
+MONTHS = {m: i for i, m in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1
+)}
+
+
+def _rate_limit_wait(response: httpx.Response) -> float:
+    """Seconds to wait before retrying, from Retry-After or x-rate-limit-reset headers (0 if absent)."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    reset = response.headers.get("x-rate-limit-reset")
+    if reset:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+    return 0.0
+
+
+async def _get_with_retry(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """GET that retries on 429 with exponential backoff (250 ms, 500 ms, 1 s), or longer if the server says so."""
+    for attempt in range(RETRY_ATTEMPTS):
+        response = await client.get(url, **kwargs)
+        if response.status_code != 429 or attempt == RETRY_ATTEMPTS - 1:
+            break
+        wait = min(MAX_RETRY_WAIT_SEC, max(_rate_limit_wait(response), 2 ** attempt * 0.25))
+        log.warning("rate_limited_retrying", url=url, attempt=attempt + 1, wait_sec=wait)
+        await asyncio.sleep(wait)
+    return response
+
 
 class TwitterSource(NewsSource):
     """
@@ -26,29 +82,29 @@ class TwitterSource(NewsSource):
     Requires Twitter API credentials (Bearer Token).
     """
     
-    def __init__(self, bearer_token: str, accounts: List[str]):
+    __slots__ = ("bearer_token", "accounts", "base_url")
+    
+    def __init__(self, bearer_token: str, accounts: Sequence[str]):
         """
         Initialize Twitter source.
         
         Args:
             bearer_token: Twitter API Bearer Token
-            accounts: List of Twitter usernames to monitor (e.g., ["federalreserve", "RBI"])
+            accounts: Twitter usernames to monitor (e.g., ["federalreserve", "RBI"])
         """
         super().__init__("twitter")
         self.bearer_token = bearer_token
-        self.accounts = accounts
+        self.accounts = tuple(accounts)
         self.base_url = "https://api.twitter.com/2"
     
     async def fetch_latest(self, lookback_hours: int = 1) -> List[NewsItem]:
         """Fetch latest tweets from monitored accounts."""
         try:
-            import httpx
-            
             items = []
             headers = {"Authorization": f"Bearer {self.bearer_token}"}
             
             # Calculate time range
-            start_time = (datetime.now(timezone.utc) - timedelta(hours=lookback_hours)).isoformat()
+            start_time = (datetime.now(UTC) - timedelta(hours=lookback_hours)).isoformat()
             
             for account in self.accounts:
                 try:
@@ -67,20 +123,25 @@ class TwitterSource(NewsSource):
                         "expansions": "referenced_tweets.id"
                     }
                     
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get(
-                            f"{self.base_url}/users/{user_id}/tweets",
-                            headers=headers,
-                            params=params,
-                            timeout=10.0
-                        )
-                        response.raise_for_status()
-                        data = response.json()
+                    client = get_http_client()
+                    response = await _get_with_retry(
+                        client,
+                        f"{self.base_url}/users/{user_id}/tweets",
+                        headers=headers,
+                        params=params,
+                        timeout=10.0
+                    )
+                    response.raise_for_status()
+                    data = response.json()
+                    await self._pace(response)
                     
                     # Parse tweets
                     for tweet in data.get("data", []):
                         item = self._parse_tweet(tweet, account)
-                        if item and self.is_relevant(item):
+                        if item is None:
+                            continue
+                        _SEEN_URLS.add(item.url)
+                        if self.is_relevant(item):
                             items.append(item)
                 
                 except Exception as e:
@@ -97,36 +158,51 @@ class TwitterSource(NewsSource):
     async def _get_user_id(self, username: str, headers: dict) -> Optional[dict]:
         """Get Twitter user ID from username."""
         try:
-            import httpx
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/users/by/username/{username}",
-                    headers=headers,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                return response.json().get("data")
+            client = get_http_client()
+            response = await _get_with_retry(
+                client,
+                f"{self.base_url}/users/by/username/{username}",
+                headers=headers,
+                timeout=10.0
+            )
+            response.raise_for_status()
+            await self._pace(response)
+            return response.json().get("data")
         except Exception as e:
             log.error("twitter_user_lookup_failed", username=username, error=str(e))
             return None
     
+    async def _pace(self, response: httpx.Response) -> None:
+        """Sleep until the rate-limit window resets when few requests remain."""
+        try:
+            remaining = int(response.headers["x-rate-limit-remaining"])
+        except (KeyError, ValueError):
+            return
+        if remaining > TWITTER_MIN_REMAINING:
+            return
+        wait = min(MAX_RETRY_WAIT_SEC, _rate_limit_wait(response) or 1.0)
+        log.info("twitter_rate_limit_pacing", remaining=remaining, wait_sec=wait)
+        await asyncio.sleep(wait)
+    
     def _parse_tweet(self, tweet: dict, account: str) -> Optional[NewsItem]:
         """Parse tweet data into NewsItem."""
         try:
-            tweet_id = tweet["id"]
+            url = f"https://twitter.com/{account}/status/{tweet['id']}"
+            if url in _SEEN_URLS:
+                return None
+            
             text = tweet["text"]
-            created_at = datetime.fromisoformat(tweet["created_at"].replace('Z', '+00:00'))
+            created_at = datetime.fromisoformat(tweet["created_at"])
             
             # Create news item
             item = NewsItem.create(
-                headline=f"@{account}: {text[:100]}...",
+                headline=f"@{account}: {_WS.sub(' ', text[:100])}...",
                 content=text,
-                url=f"https://twitter.com/{account}/status/{tweet_id}",
+                url=url,
                 source=f"twitter_{account}",
                 ts=created_at,
                 author=f"@{account}",
-                raw_json=json.dumps(tweet)
+                raw_json=orjson.dumps(tweet, default=str).decode()
             )
             
             return item
@@ -142,6 +218,8 @@ class FederalReserveSource(NewsSource):
     Scrapes: https://www.federalreserve.gov/newsevents/pressreleases.htm
     """
     
+    __slots__ = ("base_url", "press_releases_url")
+    
     def __init__(self):
         super().__init__("federal_reserve")
         self.base_url = "https://www.federalreserve.gov"
@@ -150,17 +228,14 @@ class FederalReserveSource(NewsSource):
     async def fetch_latest(self, lookback_hours: int = 24) -> List[NewsItem]:
         """Fetch latest Fed press releases."""
         try:
-            import httpx
-            from bs4 import BeautifulSoup
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.press_releases_url, timeout=10.0)
-                response.raise_for_status()
-                html = response.text
+            client = get_http_client()
+            response = await client.get(self.press_releases_url, timeout=10.0)
+            response.raise_for_status()
+            html = response.content
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             items = []
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+            cutoff_time = datetime.now(UTC) - timedelta(hours=lookback_hours)
             
             # Find press release items
             for row in soup.find_all('div', class_='row'):
@@ -171,7 +246,7 @@ class FederalReserveSource(NewsSource):
                         continue
                     
                     date_str = date_elem.get('datetime', '')
-                    pub_time = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                    pub_time = datetime.fromisoformat(date_str)
                     
                     if pub_time < cutoff_time:
                         continue
@@ -181,8 +256,10 @@ class FederalReserveSource(NewsSource):
                     if not link_elem:
                         continue
                     
-                    title = link_elem.get_text(strip=True)
                     url = self.base_url + link_elem.get('href', '')
+                    if url in _SEEN_URLS:
+                        continue
+                    title = link_elem.get_text(strip=True)
                     
                     # Fetch full content
                     content = await self._fetch_article_content(url)
@@ -196,6 +273,7 @@ class FederalReserveSource(NewsSource):
                         ts=pub_time,
                         author="Federal Reserve"
                     )
+                    _SEEN_URLS.add(url)
                     
                     if self.is_relevant(item):
                         items.append(item)
@@ -214,15 +292,16 @@ class FederalReserveSource(NewsSource):
     async def _fetch_article_content(self, url: str) -> Optional[str]:
         """Fetch full article content."""
         try:
-            import httpx
-            from bs4 import BeautifulSoup
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10.0)
+            buf = bytearray()
+            client = get_http_client()
+            async with client.stream("GET", url, timeout=10.0) as response:
                 response.raise_for_status()
-                html = response.text
+                async for chunk in response.aiter_bytes():
+                    buf.extend(chunk)
+                    if len(buf) > MAX_ARTICLE_BYTES:
+                        break
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(bytes(buf), 'lxml')
             
             # Find main content
             content_div = soup.find('div', class_='col-xs-12')
@@ -230,7 +309,7 @@ class FederalReserveSource(NewsSource):
                 # Extract text, remove scripts and styles
                 for script in content_div(["script", "style"]):
                     script.decompose()
-                text = content_div.get_text(separator=' ', strip=True)
+                text = _WS.sub(' ', content_div.get_text(separator=' ', strip=True))
                 return text[:5000]  # Limit length
             
             return None
@@ -245,6 +324,8 @@ class RBISource(NewsSource):
     Scrapes: https://www.rbi.org.in/Scripts/BS_PressReleaseDisplay.aspx
     """
     
+    __slots__ = ("base_url", "press_releases_url")
+    
     def __init__(self):
         super().__init__("rbi")
         self.base_url = "https://www.rbi.org.in"
@@ -253,17 +334,14 @@ class RBISource(NewsSource):
     async def fetch_latest(self, lookback_hours: int = 24) -> List[NewsItem]:
         """Fetch latest RBI press releases."""
         try:
-            import httpx
-            from bs4 import BeautifulSoup
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.press_releases_url, timeout=10.0)
-                response.raise_for_status()
-                html = response.text
+            client = get_http_client()
+            response = await client.get(self.press_releases_url, timeout=10.0)
+            response.raise_for_status()
+            html = response.content
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             items = []
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+            cutoff_time = datetime.now(UTC) - timedelta(hours=lookback_hours)
             
             # Find press release table
             table = soup.find('table')
@@ -278,8 +356,13 @@ class RBISource(NewsSource):
                     
                     # Extract date
                     date_str = cols[0].get_text(strip=True)
-                    # Parse date (format: "Nov 28, 2025")
-                    pub_time = datetime.strptime(date_str, "%b %d, %Y").replace(tzinfo=timezone.utc)
+                    # Parse date (format: "Nov 28, 2025", tolerating "Nov 28,2025"/"November") without strptime
+                    try:
+                        mon, day, year = date_str.replace(",", " ").split()
+                        pub_time = datetime(int(year), MONTHS[mon[:3].title()], int(day), tzinfo=UTC)
+                    except (ValueError, KeyError):
+                        log.warning("rbi_date_parse_error", date=date_str)
+                        continue
                     
                     if pub_time < cutoff_time:
                         continue
@@ -289,8 +372,10 @@ class RBISource(NewsSource):
                     if not link_elem:
                         continue
                     
-                    title = link_elem.get_text(strip=True)
                     url = self.base_url + link_elem.get('href', '')
+                    if url in _SEEN_URLS:
+                        continue
+                    title = link_elem.get_text(strip=True)
                     
                     # Create news item
                     item = NewsItem.create(
@@ -301,6 +386,7 @@ class RBISource(NewsSource):
                         ts=pub_time,
                         author="Reserve Bank of India"
                     )
+                    _SEEN_URLS.add(url)
                     
                     if self.is_relevant(item):
                         items.append(item)
@@ -324,40 +410,53 @@ class ECBSource(NewsSource):
     Uses ECB's RSS feed.
     """
     
-    def __init__(self):
+    __slots__ = ("feed_url", "store_raw")
+    
+    def __init__(self, store_raw: bool = False):
+        """
+        Initialize ECB source.
+        
+        Args:
+            store_raw: Serialize each feed entry into raw_json (off by default)
+        """
         super().__init__("ecb")
         self.feed_url = "https://www.ecb.europa.eu/rss/press.html"
+        self.store_raw = store_raw
     
     async def fetch_latest(self, lookback_hours: int = 24) -> List[NewsItem]:
         """Fetch latest ECB press releases."""
         try:
-            import feedparser
-            
-            feed = feedparser.parse(self.feed_url)
+            feed = await asyncio.to_thread(feedparser.parse, self.feed_url)
             items = []
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+            now = datetime.now(UTC)
+            cutoff_time = now - timedelta(hours=lookback_hours)
             
             for entry in feed.entries:
                 try:
                     # Parse publication date
                     if hasattr(entry, 'published_parsed'):
-                        pub_time = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                        pub_time = datetime(*entry.published_parsed[:6], tzinfo=UTC)
                     else:
-                        pub_time = datetime.now(timezone.utc)
+                        pub_time = now
                     
                     if pub_time < cutoff_time:
                         continue
                     
+                    url = entry.get('link', '')
+                    if url and url in _SEEN_URLS:
+                        continue
+                    
                     # Create news item
                     item = NewsItem.create(
                         headline=entry.get('title', ''),
                         content=entry.get('summary', ''),
-                        url=entry.get('link', ''),
+                        url=url,
                         source="ecb",
                         ts=pub_time,
                         author="European Central Bank",
-                        raw_json=json.dumps(dict(entry))
+                        raw_json=orjson.dumps(dict(entry), default=str).decode() if self.store_raw else ""
                     )
+                    _SEEN_URLS.add(url)
                     
                     if self.is_relevant(item):
                         items.append(item)
@@ -381,6 +480,8 @@ class BOJSource(NewsSource):
     Scrapes: https://www.boj.or.jp/en/announcements/index.htm
     """
     
+    __slots__ = ("base_url", "announcements_url")
+    
     def __init__(self):
         super().__init__("boj")
         self.base_url = "https://www.boj.or.jp"
@@ -389,17 +490,14 @@ class BOJSource(NewsSource):
     async def fetch_latest(self, lookback_hours: int = 24) -> List[NewsItem]:
         """Fetch latest BOJ announcements."""
         try:
-            import httpx
-            from bs4 import BeautifulSoup
+            client = get_http_client()
+            response = await client.get(self.announcements_url, timeout=10.0)
+            response.raise_for_status()
+            html = response.content
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.announcements_url, timeout=10.0)
-                response.raise_for_status()
-                html = response.text
-            
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             items = []
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+            cutoff_time = datetime.now(UTC) - timedelta(hours=lookback_hours)
             
             # Find announcement items
             for item_div in soup.find_all('div', class_='release'):
@@ -420,8 +518,10 @@ class BOJSource(NewsSource):
                     if not link_elem:
                         continue
                     
-                    title = link_elem.get_text(strip=True)
                     url = self.base_url + link_elem.get('href', '')
+                    if url in _SEEN_URLS:
+                        continue
+                    title = link_elem.get_text(strip=True)
                     
                     # Create news item
                     item = NewsItem.create(
@@ -432,6 +532,7 @@ class BOJSource(NewsSource):
                         ts=pub_time,
                         author="Bank of Japan"
                     )
+                    _SEEN_URLS.add(url)
                     
                     if self.is_relevant(item):
                         items.append(item)
@@ -455,26 +556,24 @@ class TradingEconomicsSource(NewsSource):
     Requires Trading Economics API key.
     """
     
-    def __init__(self, api_key: str, countries: List[str] = None):
+    __slots__ = ("api_key", "countries", "base_url")
+    
+    def __init__(self, api_key: str, countries: Optional[Sequence[str]] = None):
         """
         Initialize Trading Economics source.
         
         Args:
             api_key: Trading Economics API key
-            countries: List of country codes (e.g., ["US", "IN", "EU"])
+            countries: Country codes (e.g., ["US", "IN", "EU"])
         """
         super().__init__("trading_economics")
         self.api_key = api_key
-        self.countries = countries or ["US", "IN", "EU", "GB", "JP"]
+        self.countries = tuple(countries or ("US", "IN", "EU", "GB", "JP"))
         self.base_url = "https://api.tradingeconomics.com"
     
     async def fetch_latest(self, lookback_hours: int = 24) -> List[NewsItem]:
         """Fetch upcoming economic events."""
         try:
-            import httpx
-            
-            items = []
-            
             # Fetch calendar events
             params = {
                 "c": self.api_key,
@@ -482,22 +581,24 @@ class TradingEconomicsSource(NewsSource):
                 "format": "json"
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/calendar",
-                    params=params,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                events = response.json()
+            client = get_http_client()
+            response = await _get_with_retry(
+                client,
+                f"{self.base_url}/calendar",
+                params=params,
+                timeout=10.0
+            )
+            response.raise_for_status()
+            events = response.json()
             
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+            rows = []
+            cutoff_time = datetime.now(UTC) - timedelta(hours=lookback_hours)
             
             for event in events:
                 try:
                     # Parse event time
                     date_str = event.get("Date", "")
-                    pub_time = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                    pub_time = datetime.fromisoformat(date_str)
                     
                     if pub_time < cutoff_time:
                         continue
@@ -512,24 +613,24 @@ class TradingEconomicsSource(NewsSource):
                     headline = f"{country}: {event_name}"
                     content = f"{event_name} - Actual: {actual}, Forecast: {forecast}, Previous: {previous}"
                     
-                    # Create news item
-                    item = NewsItem.create(
-                        headline=headline,
-                        content=content,
-                        url=f"https://tradingeconomics.com/{country}/calendar",
-                        source="trading_economics",
-                        ts=pub_time,
-                        author="Trading Economics",
-                        raw_json=json.dumps(event)
-                    )
-                    
-                    if self.is_relevant(item):
-                        items.append(item)
+                    # Collect row (no URL dedup: the calendar URL is shared by
+                    # every event for a country)
+                    rows.append({
+                        "headline": headline,
+                        "content": content,
+                        "url": f"https://tradingeconomics.com/{country}/calendar",
+                        "source": "trading_economics",
+                        "ts": pub_time,
+                        "author": "Trading Economics",
+                        "raw_json": orjson.dumps(event, default=str).decode()
+                    })
                 
                 except Exception as e:
                     log.warning("trading_economics_event_parse_error", error=str(e))
                     continue
             
+            items = [item for item in NewsItem.bulk_create(rows) if self.is_relevant(item)]
+            
             log.info("trading_economics_fetch_complete", count=len(items))
             return items
         
@@ -545,6 +646,8 @@ class FinnhubNewsSource(NewsSource):
     Requires Finnhub API key (free tier available).
     """
     
+    __slots__ = ("api_key", "base_url")
+    
     def __init__(self, api_key: str):
         super().__init__("finnhub")
         self.api_key = api_key
@@ -553,11 +656,10 @@ class FinnhubNewsSource(NewsSource):
     async def fetch_latest(self, lookback_hours: int = 24) -> List[NewsItem]:
         """Fetch latest forex news from Finnhub."""
         try:
-            import httpx
-            
             # Calculate time range (Unix timestamp)
-            from_time = int((datetime.now(timezone.utc) - timedelta(hours=lookback_hours)).timestamp())
-            to_time = int(datetime.now(timezone.utc).timestamp())
+            now = datetime.now(UTC)
+            from_time = int((now - timedelta(hours=lookback_hours)).timestamp())
+            to_time = int(now.timestamp())
             
             params = {
                 "category": "forex",
@@ -566,39 +668,43 @@ class FinnhubNewsSource(NewsSource):
                 "to": to_time
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/news",
-                    params=params,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                news_items = response.json()
+            client = get_http_client()
+            response = await _get_with_retry(
+                client,
+                f"{self.base_url}/news",
+                params=params,
+                timeout=10.0
+            )
+            response.raise_for_status()
+            news_items = response.json()
             
-            items = []
+            rows = []
             for article in news_items:
                 try:
-                    # Parse timestamp
-                    pub_time = datetime.fromtimestamp(article.get("datetime", 0), tz=timezone.utc)
-                    
-                    # Create news item
-                    item = NewsItem.create(
-                        headline=article.get("headline", ""),
-                        content=article.get("summary", ""),
-                        url=article.get("url", ""),
-                        source=f"finnhub_{article.get('source', 'unknown')}",
-                        ts=pub_time,
-                        author=article.get("source", ""),
-                        raw_json=json.dumps(article)
-                    )
+                    url = article.get("url", "")
+                    if url and url in _SEEN_URLS:
+                        continue
                     
-                    if self.is_relevant(item):
-                        items.append(item)
+                    # Parse timestamp
+                    pub_time = datetime.fromtimestamp(article.get("datetime", 0), tz=UTC)
+                    
+                    rows.append({
+                        "headline": article.get("headline", ""),
+                        "content": article.get("summary", ""),
+                        "url": url,
+                        "source": f"finnhub_{article.get('source', 'unknown')}",
+                        "ts": pub_time,
+                        "author": article.get("source", ""),
+                        "raw_json": orjson.dumps(article, default=str).decode()
+                    })
+                    _SEEN_URLS.add(url)
                 
                 except Exception as e:
                     log.warning("finnhub_article_parse_error", error=str(e))
                     continue
             
+            items = [item for item in NewsItem.bulk_create(rows) if self.is_relevant(item)]
+            
             log.info("finnhub_fetch_complete", count=len(items))
             return items
         
@@ -608,17 +714,17 @@ class FinnhubNewsSource(NewsSource):
 
 
 # Predefined central bank Twitter accounts
-CENTRAL_BANK_TWITTER_ACCOUNTS = [
+CENTRAL_BANK_TWITTER_ACCOUNTS = (
     "federalreserve",  # US Federal Reserve
     "RBI",             # Reserve Bank of India
     "ecb",             # European Central Bank
     "bankofengland",   # Bank of England
     "bankofcanada",    # Bank of Canada
     "RBA_Media",       # Reserve Bank of Australia
-]
+)
 
 # Financial news Twitter accounts
-FINANCIAL_NEWS_TWITTER_ACCOUNTS = [
+FINANCIAL_NEWS_TWITTER_ACCOUNTS = (
     "Reuters",
     "Bloomberg",
     "WSJ",
@@ -626,7 +732,7 @@ FINANCIAL_NEWS_TWITTER_ACCOUNTS = [
     "CNBC",
     "ForexLive",
     "FXStreetNews",
-]
+)
 
 
 def create_advanced_sources(
@@ -679,3 +785,4 @@ def create_advanced_sources(
         sources.append(FinnhubNewsSource(finnhub_key))
     
     return sources
+
@@ -2,16 +2,58 @@
 News source interfaces for fetching articles from various providers.
 """
 from __future__ import annotations
+import asyncio
+import functools
 import hashlib
-import json
+import math
+import re
+import orjson
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Sequence
+import httpx
 import structlog
 
+try:
+    import ahocorasick  # optional (pyahocorasick, faster relevance scan)
+except Exception:
+    ahocorasick = None
+
 log = structlog.get_logger()
 
+# FX-related keywords used by NewsSource.is_relevant
+RELEVANCE_KEYWORDS = (
+    "forex", "exchange rate", "currency", "central bank",
+    "fed", "federal reserve", "rbi", "ecb", "boj",
+    "interest rate", "monetary policy", "inflation",
+    "usd", "inr", "eur", "gbp", "jpy",
+    "dollar", "rupee", "euro", "pound", "yen"
+)
+
+# Built once at import and shared by every source: an Aho-Corasick automaton
+# when pyahocorasick is installed, otherwise one precompiled case-insensitive
+# alternation (substring matches, same as the automaton)
+_KW_RE = re.compile("|".join(map(re.escape, RELEVANCE_KEYWORDS)), re.IGNORECASE)
+_KW_AUTOMATON = None
+if ahocorasick is not None:
+    _KW_AUTOMATON = ahocorasick.Automaton()
+    for _kw in RELEVANCE_KEYWORDS:
+        _KW_AUTOMATON.add_word(_kw, _kw)
+    _KW_AUTOMATON.make_automaton()
+
+
+def relevance_matcher_name() -> str:
+    """Which keyword matcher `NewsSource.is_relevant` uses (for diagnostics)."""
+    return "Aho-Corasick automaton" if _KW_AUTOMATON is not None else "precompiled regex"
+
+
+@functools.lru_cache(maxsize=65536)
+def _mk_id(url: str, ts_iso: str) -> str:
+    """Item ID: 8-byte BLAKE2b digest (16 hex chars) of url + "_" + timestamp."""
+    return hashlib.blake2b(f"{url}_{ts_iso}".encode(), digest_size=8).hexdigest()
+
 
 @dataclass
 class NewsItem:
@@ -33,12 +75,8 @@ class NewsItem:
         if ts is None:
             ts = datetime.now(timezone.utc)
         
-        # Generate unique ID from url + timestamp
-        id_str = f"{url}_{ts.isoformat()}"
-        item_id = hashlib.sha256(id_str.encode()).hexdigest()[:16]
-        
         return cls(
-            id=item_id,
+            id=_mk_id(url, ts.isoformat()),
             ts=ts,
             source=source,
             headline=headline,
@@ -47,19 +85,170 @@ class NewsItem:
             **kwargs
         )
     
+    @classmethod
+    def bulk_create(cls, rows: List[dict]) -> List[NewsItem]:
+        """
+        Create NewsItems from trusted row dicts without going through __init__.
+        
+        Each row carries the same fields as create(): headline, content, url,
+        source, ts and optionally author/language/raw_json.
+        """
+        items = []
+        for row in rows:
+            ts = row.get("ts") or datetime.now(timezone.utc)
+            item = object.__new__(cls)
+            item.__dict__.update(
+                id=_mk_id(row["url"], ts.isoformat()),
+                author="",
+                language="en",
+                raw_json="",
+            )
+            item.__dict__.update(row)
+            item.ts = ts
+            items.append(item)
+        return items
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for database insertion."""
-        d = asdict(self)
-        # Convert datetime to string for ClickHouse
-        d['ts'] = self.ts.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        return d
+        # Flat fields only, so build the dict directly rather than via asdict's deep copy
+        return {
+            "id": self.id,
+            "ts": self.ts.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],  # ClickHouse DateTime64(3) string
+            "source": self.source,
+            "headline": self.headline,
+            "content": self.content,
+            "url": self.url,
+            "author": self.author,
+            "language": self.language,
+            "raw_json": self.raw_json,
+        }
+
+
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_HTTP_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_CLOSING: set = set()  # in-flight stale-client closes (tasks are only weakly referenced by the loop)
+
+
+async def _close_stale_client(client: httpx.AsyncClient) -> None:
+    """Close a client left over from a previous event loop."""
+    try:
+        await client.aclose()
+    except Exception as e:
+        # Its connections belong to the old (usually closed) loop; whatever can't be
+        # shut down cleanly from here is released when the client is collected
+        log.debug("stale_http_client_close_failed", error=str(e))
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the HTTP client shared by all news sources.
+    
+    Connections (and their TLS sessions) are kept alive across polls. A new client
+    is created if the running event loop changed, since a client is bound to the
+    loop it was first used on.
+    """
+    global _HTTP_CLIENT, _HTTP_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP_CLIENT is None or _HTTP_CLIENT_LOOP is not loop:
+        if _HTTP_CLIENT is not None:
+            # Close the stale client rather than just dropping it, so its pooled sockets
+            # don't linger until garbage collection
+            task = loop.create_task(_close_stale_client(_HTTP_CLIENT))
+            _CLOSING.add(task)
+            task.add_done_callback(_CLOSING.discard)
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+        _HTTP_CLIENT_LOOP = loop
+    return _HTTP_CLIENT
+
+
+class RecentKeys:
+    """Bounded set of recently seen keys; the least recently seen are evicted first."""
+    
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._keys: OrderedDict[str, None] = OrderedDict()
+    
+    def __contains__(self, key: str) -> bool:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+        return False
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def add(self, key: str) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        if len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+
+
+class BloomDedup:
+    """
+    Approximate "seen before?" set for item IDs, using two rotating Bloom filter generations.
+    
+    The active generation takes new keys; once it holds `capacity` keys it becomes the
+    retired generation and a fresh one starts, so the window covers the last
+    `capacity`..`2 * capacity` keys and the false-positive rate stays near `fpr`.
+    """
+    
+    def __init__(self, capacity: int = 10000, fpr: float = 1e-4):
+        self.capacity = capacity
+        self.num_bits = math.ceil(-capacity * math.log(fpr) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._active = bytearray((self.num_bits + 7) // 8)
+        self._retired = bytearray(len(self._active))
+        self._count = 0
+    
+    def _indices(self, key: str) -> List[int]:
+        # Double hashing: k bit positions from the two halves of one 16-byte digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    @staticmethod
+    def _has_all(bits: bytearray, indices: List[int]) -> bool:
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in indices)
+    
+    def contains_and_add(self, key: str) -> bool:
+        """Add `key` and return True if it was (probably) already present."""
+        indices = self._indices(key)
+        if self._has_all(self._active, indices):
+            return True
+        seen = self._has_all(self._retired, indices)
+        for i in indices:
+            self._active[i >> 3] |= 1 << (i & 7)
+        self._count += 1
+        if self._count >= self.capacity:
+            self._retired = self._active
+            self._active = bytearray(len(self._retired))
+            self._count = 0
+        return seen
 
 
 class NewsSource(ABC):
     """Abstract base class for news sources."""
     
+    __slots__ = ("source_name", "_seen_ids")
+    
     def __init__(self, source_name: str):
         self.source_name = source_name
+        # IDs already produced by this source; skipped on later polls
+        self._seen_ids = RecentKeys(maxsize=8192)
+    
+    def _is_new(self, url: str, ts: datetime) -> bool:
+        """Record the item ID for (url, ts) and report whether it was unseen."""
+        item_id = _mk_id(url, ts.isoformat())
+        if item_id in self._seen_ids:
+            return False
+        self._seen_ids.add(item_id)
+        return True
     
     @abstractmethod
     async def fetch_latest(self, lookback_hours: int = 1) -> List[NewsItem]:
@@ -81,21 +270,18 @@ class NewsSource(ABC):
         Override this method for custom filtering logic.
         """
         # Basic relevance check: contains FX-related keywords
-        keywords = [
-            "forex", "exchange rate", "currency", "central bank",
-            "fed", "federal reserve", "rbi", "ecb", "boj",
-            "interest rate", "monetary policy", "inflation",
-            "usd", "inr", "eur", "gbp", "jpy",
-            "dollar", "rupee", "euro", "pound", "yen"
-        ]
-        
-        text = (item.headline + " " + item.content).lower()
-        return any(keyword in text for keyword in keywords)
+        if _KW_AUTOMATON is not None:
+            text = (item.headline + " " + item.content).lower()
+            return next(_KW_AUTOMATON.iter(text), None) is not None
+        # Headline first: most relevant items match there without scanning the body
+        return _KW_RE.search(item.headline) is not None or _KW_RE.search(item.content) is not None
 
 
 class RSSSource(NewsSource):
     """Fetch news from RSS feeds."""
     
+    __slots__ = ("feed_url",)
+    
     def __init__(self, source_name: str, feed_url: str):
         super().__init__(source_name)
         self.feed_url = feed_url
@@ -106,8 +292,8 @@ class RSSSource(NewsSource):
             import feedparser
             from datetime import timedelta
             
-            # Parse feed
-            feed = feedparser.parse(self.feed_url)
+            # Parse feed off the event loop (feedparser blocks on the download)
+            feed = await asyncio.to_thread(feedparser.parse, self.feed_url)
             
             items = []
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
@@ -126,10 +312,14 @@ class RSSSource(NewsSource):
                     if pub_time < cutoff_time:
                         continue
                     
+                    # Skip entries already produced on an earlier poll
+                    url = entry.get('link', '')
+                    if not self._is_new(url, pub_time):
+                        continue
+                    
                     # Extract content
                     headline = entry.get('title', '')
                     content = entry.get('summary', '') or entry.get('description', '')
-                    url = entry.get('link', '')
                     author = entry.get('author', '')
                     
                     # Create news item
@@ -140,7 +330,7 @@ class RSSSource(NewsSource):
                         source=self.source_name,
                         ts=pub_time,
                         author=author,
-                        raw_json=json.dumps(dict(entry))
+                        raw_json=orjson.dumps(dict(entry), default=str).decode()
                     )
                     
                     # Filter for relevance
@@ -162,6 +352,8 @@ class RSSSource(NewsSource):
 class NewsAPISource(NewsSource):
     """Fetch news from NewsAPI.org."""
     
+    __slots__ = ("api_key", "query", "base_url")
+    
     def __init__(self, api_key: str, query: str = "forex OR currency OR \"central bank\""):
         super().__init__("newsapi")
         self.api_key = api_key
@@ -171,7 +363,6 @@ class NewsAPISource(NewsSource):
     async def fetch_latest(self, lookback_hours: int = 1) -> List[NewsItem]:
         """Fetch latest news from NewsAPI."""
         try:
-            import httpx
             from datetime import timedelta
             
             # Calculate time range
@@ -186,27 +377,31 @@ class NewsAPISource(NewsSource):
                 "apiKey": self.api_key
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.base_url, params=params, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client()
+            response = await client.get(self.base_url, params=params, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
             
             items = []
             for article in data.get("articles", []):
                 try:
                     # Parse timestamp
                     pub_time_str = article.get("publishedAt", "")
-                    pub_time = datetime.fromisoformat(pub_time_str.replace('Z', '+00:00'))
+                    pub_time = datetime.fromisoformat(pub_time_str)  # Python 3.11+ accepts 'Z'
+                    
+                    url = article.get("url", "")
+                    if not self._is_new(url, pub_time):
+                        continue
                     
                     # Create news item
                     item = NewsItem.create(
                         headline=article.get("title", ""),
                         content=article.get("description", "") + "\n\n" + article.get("content", ""),
-                        url=article.get("url", ""),
+                        url=url,
                         source=f"newsapi_{article.get('source', {}).get('name', 'unknown')}",
                         ts=pub_time,
                         author=article.get("author", ""),
-                        raw_json=json.dumps(article)
+                        raw_json=orjson.dumps(article, default=str).decode()
                     )
                     
                     if self.is_relevant(item):
@@ -227,6 +422,8 @@ class NewsAPISource(NewsSource):
 class AlphaVantageNewsSource(NewsSource):
     """Fetch news from Alpha Vantage News API."""
     
+    __slots__ = ("api_key", "topics", "base_url")
+    
     def __init__(self, api_key: str, topics: str = "forex,economy"):
         super().__init__("alphavantage")
         self.api_key = api_key
@@ -236,7 +433,6 @@ class AlphaVantageNewsSource(NewsSource):
     async def fetch_latest(self, lookback_hours: int = 1) -> List[NewsItem]:
         """Fetch latest news from Alpha Vantage."""
         try:
-            import httpx
             from datetime import timedelta
             
             params = {
@@ -247,10 +443,10 @@ class AlphaVantageNewsSource(NewsSource):
                 "limit": 50
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.base_url, params=params, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client()
+            response = await client.get(self.base_url, params=params, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
             
             items = []
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
@@ -259,21 +455,28 @@ class AlphaVantageNewsSource(NewsSource):
                 try:
                     # Parse timestamp
                     time_str = article.get("time_published", "")
-                    # Format: YYYYMMDDTHHMMSS
-                    pub_time = datetime.strptime(time_str, "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc)
+                    # Format: YYYYMMDDTHHMMSS (fixed width, so slice instead of strptime)
+                    s = time_str
+                    pub_time = datetime(int(s[0:4]), int(s[4:6]), int(s[6:8]),
+                                        int(s[9:11]), int(s[11:13]), int(s[13:15]),
+                                        tzinfo=timezone.utc)
                     
                     if pub_time < cutoff_time:
                         continue
                     
+                    url = article.get("url", "")
+                    if not self._is_new(url, pub_time):
+                        continue
+                    
                     # Create news item
                     item = NewsItem.create(
                         headline=article.get("title", ""),
                         content=article.get("summary", ""),
-                        url=article.get("url", ""),
+                        url=url,
                         source=f"alphavantage_{article.get('source', 'unknown')}",
                         ts=pub_time,
                         author=article.get("authors", [""])[0] if article.get("authors") else "",
-                        raw_json=json.dumps(article)
+                        raw_json=orjson.dumps(article, default=str).decode()
                     )
                     
                     if self.is_relevant(item):
@@ -291,6 +494,31 @@ class AlphaVantageNewsSource(NewsSource):
             return []
 
 
+async def fetch_all_sources(sources: Sequence[NewsSource], lookback_hours: int = 24,
+                            concurrency: int = 8) -> list:
+    """
+    Fetch from all sources concurrently.
+    
+    This is the intended entry point for polling a set of sources: total latency
+    is bounded by the slowest source rather than the sum of all of them.
+    
+    Args:
+        sources: News sources to poll
+        lookback_hours: How far back to fetch news
+        concurrency: Max sources fetched at the same time
+    
+    Returns:
+        One entry per source, in order: its list of NewsItem, or the exception it raised
+    """
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def _run(source: NewsSource) -> List[NewsItem]:
+        async with sem:
+            return await source.fetch_latest(lookback_hours)
+    
+    return await asyncio.gather(*map(_run, sources), return_exceptions=True)
+
+
 # Predefined RSS feeds for major financial news sources
 DEFAULT_RSS_FEEDS = {
     # Major News Agencies
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import os
-import json
+import time
+from functools import lru_cache
+import orjson
 from datetime import datetime
 import numpy as np
 import pandas as pd
@@ -18,28 +20,36 @@ FEATURE_SET = [
     "ret_1m", "ret_5m", "ret_15m", "vol_5m", "vol_15m",
     "sma_5", "sma_15", "momentum_15m", "minutes_to_event", "is_high_importance"
 ]
+CATEGORICAL_FEATURE = "is_high_importance"
 
 
 def load_features(pair: str, lookback_hours: int) -> pd.DataFrame:
+    # Repeated loads within the same wall-clock minute (e.g. parameter sweeps) reuse one query;
+    # callers get a copy so they can mutate it freely
+    return _load_features_cached(pair, lookback_hours, int(time.time() // 60)).copy()
+
+
+@lru_cache(maxsize=16)
+def _load_features_cached(pair: str, lookback_hours: int, minute_bucket: int) -> pd.DataFrame:
     sql = f"""
         SELECT ts, pair, {', '.join(FEATURE_SET)}
         FROM fxai.features_1m
-        WHERE pair = '{pair}'
-          AND ts >= now() - INTERVAL {lookback_hours} HOUR
+        WHERE pair = {{pair:String}}
+          AND ts >= now() - INTERVAL {{hours:UInt32}} HOUR
         ORDER BY ts
     """
-    return query_df(sql)
+    return query_df(sql, parameters={"pair": pair, "hours": lookback_hours})
 
 
 def train_classifier(df_feats: pd.DataFrame, df_labels: pd.DataFrame):
-    # First, try exact ts alignment
-    df = df_feats.merge(df_labels, on="ts", how="inner")
-
-    if df.empty:
-        # Fallback: allow up to 1 minute tolerance using merge_asof on sorted ts
-        f = df_feats.sort_values("ts").reset_index(drop=True)
-        l = df_labels.sort_values("ts").reset_index(drop=True)
-        df = pd.merge_asof(f, l, on="ts", direction="nearest", tolerance=pd.Timedelta("1min"))
+    # Align on nearest ts within 1 minute (exact matches included) in one merge_asof pass;
+    # both inputs normally arrive sorted (ORDER BY ts / labels sort), so only re-sort if needed
+    f = df_feats if df_feats["ts"].is_monotonic_increasing else df_feats.sort_values("ts")
+    l = df_labels if df_labels["ts"].is_monotonic_increasing else df_labels.sort_values("ts")
+    df = pd.merge_asof(
+        f.reset_index(drop=True), l.reset_index(drop=True),
+        on="ts", direction="nearest", tolerance=pd.Timedelta("1min"),
+    )
 
     df = df.dropna().reset_index(drop=True)
     if df.empty:
@@ -51,7 +61,11 @@ def train_classifier(df_feats: pd.DataFrame, df_labels: pd.DataFrame):
         labels_span = _span(df_labels)
         raise RuntimeError(f"No aligned feature-label rows; feats_span={feats_span}; labels_span={labels_span}")
 
-    X = df[FEATURE_SET].values
+    # float32 matches LightGBM's internal binning precision (half the memory traffic of float64);
+    # the event-importance flag is a 0/1 category
+    dtypes = {c: "float32" for c in FEATURE_SET}
+    dtypes[CATEGORICAL_FEATURE] = "int8"
+    X = df[FEATURE_SET].astype(dtypes).values
     y = df["y_up"].values
 
     # Time-ordered split: last 20% as validation
@@ -69,8 +83,10 @@ def train_classifier(df_feats: pd.DataFrame, df_labels: pd.DataFrame):
         random_state=42,
         n_jobs=-1,
         class_weight="balanced",
+        device_type="cpu",
+        force_col_wise=True,
     )
-    clf.fit(X_train, y_train)
+    clf.fit(X_train, y_train, categorical_feature=[FEATURE_SET.index(CATEGORICAL_FEATURE)])
 
     # Metrics
     prob_valid = clf.predict_proba(X_valid)[:, 1]
@@ -121,7 +137,7 @@ def main():
             FEATURE_SET,
             t_start,
             t_end,
-            json.dumps(metrics),
+            orjson.dumps(metrics).decode(),
         )],
         [
             "model_id",
@@ -1,7 +1,11 @@
 from __future__ import annotations
 import os
 import time
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import structlog
+import numpy as np
 import pandas as pd
 
 try:
@@ -9,92 +13,170 @@ try:
 except Exception:  # pragma: no cover
     httpx = None
 
-from apps.common.clickhouse_client import query_df, insert_rows
+from apps.common.clickhouse_client import query_df, query_scalar, insert_df
 
 log = structlog.get_logger()
 
 ALERT_POLL_SEC = int(os.getenv("ALERT_POLL_SEC", "30"))
 ALERT_LOOKBACK_MIN = int(os.getenv("ALERT_LOOKBACK_MIN", "120"))
 ALERT_WEBHOOK_URL = "https://webhook.site/2ce2c74a-8012-4fd7-bf6f-e728b529b886" # os.getenv("ALERT_WEBHOOK_URL")  # optional
-
-
+ALERT_WEBHOOK_WORKERS = int(os.getenv("ALERT_WEBHOOK_WORKERS", "8"))
+
+# One keep-alive client for the process lifetime (shared by the webhook worker threads)
+_WEBHOOK_CLIENT = None
+if httpx is not None:
+    _WEBHOOK_CLIENT = httpx.Client(
+        timeout=5.0, limits=httpx.Limits(max_keepalive_connections=ALERT_WEBHOOK_WORKERS))
+    atexit.register(_WEBHOOK_CLIENT.close)
+
+ALERT_COLUMNS = [
+    "decision_ts",
+    "pair",
+    "horizon",
+    "prob_up",
+    "expected_delta_bps",
+    "recommendation",
+    "direction",
+    "action_hint",
+    "model_id",
+    "explanation",
+    "embargo_applied",
+    "sent",
+    "dest",
+]
+
+# Column dtypes matching fxai.alerts, so insert_df ships each column without per-value conversion
+ALERT_DTYPES = {
+    "prob_up": "float64",
+    "expected_delta_bps": "float64",
+    "embargo_applied": "uint8",
+    "sent": "uint8",
+}
+
+
+@lru_cache(maxsize=64)
 def _split_pair(p: str) -> tuple[str, str]:
     p = (p or "").upper()
     return p[:3], p[3:6]
 
 
-def infer_direction_and_hint(pair: str, prob_up: float, exp_bps: float) -> tuple[str, str]:
+_UP_TMPL = (
+    "{base} likely to strengthen vs {quote}. If you need to BUY {base}, "
+    "consider acting sooner; if you plan to SELL {base}, delaying may help."
+)
+_DN_TMPL = (
+    "{base} likely to weaken vs {quote}. If you need to SELL {base}, "
+    "consider acting sooner; if you plan to BUY {base}, waiting may help."
+)
+
+
+def _action_hint(pair: str, direction: str) -> str:
     base, quote = _split_pair(pair)
-    sign = exp_bps if abs(exp_bps) > 1e-9 else (2.0 * float(prob_up) - 1.0)
-    direction = "UP" if sign >= 0 else "DOWN"
-    if direction == "UP":
-        hint = (
-            f"{base} likely to strengthen vs {quote}. If you need to BUY {base}, "
-            f"consider acting sooner; if you plan to SELL {base}, delaying may help."
-        )
-    else:
-        hint = (
-            f"{base} likely to weaken vs {quote}. If you need to SELL {base}, "
-            f"consider acting sooner; if you plan to BUY {base}, waiting may help."
-        )
-    return direction, hint
+    return (_UP_TMPL if direction == "UP" else _DN_TMPL).format(base=base, quote=quote)
 
 
-def fetch_new_now_decisions(lookback_min: int) -> pd.DataFrame:
-    sql = f"""
-        SELECT d.ts AS decision_ts, d.pair, d.horizon,
-               d.posterior_prob_up AS prob_up,
-               coalesce(d.expected_delta_bps, 0.0) AS expected_delta_bps,
-               d.recommendation,
-               d.explanation,
-               d.policy_version AS model_id
+def infer_directions_vec(pairs, probs, deltas) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Direction ("UP"/"DOWN") and action hint for aligned pair/prob_up/expected_delta_bps arrays.
+    
+    Direction follows the sign of expected_delta_bps, falling back to prob_up - 0.5
+    when the expected move is zero.
+    """
+    probs = np.asarray(probs, dtype=float)
+    deltas = np.asarray(deltas, dtype=float)
+    sign = np.where(np.abs(deltas) > 1e-9, deltas, 2.0 * probs - 1.0)
+    direction = np.where(sign >= 0, "UP", "DOWN")
+    # Hint text depends only on (pair, direction): format each distinct combination once
+    keys = list(zip(pairs, direction))
+    hint_by_key = {k: _action_hint(*k) for k in set(keys)}
+    hints = np.array([hint_by_key[k] for k in keys], dtype=object)
+    return direction, hints
+
+
+_NEW_NOW_DECISIONS_FROM = """
         FROM fxai.decisions AS d
         LEFT JOIN fxai.alerts AS a
           ON a.decision_ts = toDateTime(d.ts)
          AND a.pair = d.pair
          AND a.horizon = d.horizon
-        WHERE d.ts >= now() - INTERVAL {lookback_min} MINUTE
+        WHERE d.ts >= now() - INTERVAL {lookback_min:UInt32} MINUTE
           AND d.recommendation = 'NOW'
           AND a.decision_ts IS NULL
+"""
+
+
+def fetch_new_now_decisions(lookback_min: int) -> pd.DataFrame:
+    params = {"lookback_min": lookback_min}
+    # Most polls find nothing new; probe with count() before materializing a DataFrame
+    if query_scalar("SELECT count()" + _NEW_NOW_DECISIONS_FROM, parameters=params) == 0:
+        return pd.DataFrame()
+    sql = """
+        SELECT d.ts AS decision_ts, d.pair, d.horizon,
+               d.posterior_prob_up AS prob_up,
+               coalesce(d.expected_delta_bps, 0.0) AS expected_delta_bps,
+               d.recommendation,
+               d.explanation,
+               d.policy_version AS model_id
+    """ + _NEW_NOW_DECISIONS_FROM + """
         ORDER BY d.ts
     """
-    return query_df(sql)
+    return query_df(sql, parameters=params)
 
 
 def post_webhook(payload: dict) -> bool:
-    if not ALERT_WEBHOOK_URL or httpx is None:
+    if not ALERT_WEBHOOK_URL or _WEBHOOK_CLIENT is None:
         return False
     try:
-        with httpx.Client(timeout=5.0) as client:
-            r = client.post(ALERT_WEBHOOK_URL, json=payload)
-            return r.status_code // 100 == 2
+        r = _WEBHOOK_CLIENT.post(ALERT_WEBHOOK_URL, json=payload)
+        return r.status_code // 100 == 2
     except Exception:
         log.exception("webhook_post_error")
         return False
 
 
-def insert_alert_rows(rows: list[tuple]):
-    insert_rows(
-        "fxai.alerts",
-        rows,
-        [
-            
-            "decision_ts",
-            "pair",
-            "horizon",
-            "prob_up",
-            "expected_delta_bps",
-            "recommendation",
-            "direction",
-            "action_hint",
-            "model_id",
-            "explanation",
-            "embargo_applied",
-            "sent",
-            "dest",
-        ],
+def build_alerts(df: pd.DataFrame) -> pd.DataFrame:
+    """Annotate NOW decisions with direction/hint, post webhooks, and return fxai.alerts rows."""
+    prob_up = df["prob_up"].astype(float)
+    exp_bps = df["expected_delta_bps"].astype(float)
+    direction, hints = infer_directions_vec(df["pair"], prob_up, exp_bps)
+    df = df.assign(
+        prob_up=prob_up,
+        expected_delta_bps=exp_bps,
+        direction=direction,
+        action_hint=hints,
+        recommendation="NOW",
+        embargo_applied=0,  # not evaluated here
     )
 
+    payloads = []
+    for r in df.itertuples(index=False):
+        payloads.append({
+            "pair": r.pair,
+            "h": r.horizon,
+            "prob_up": r.prob_up,
+            "expected_delta_bps": r.expected_delta_bps,
+            "direction": r.direction,
+            "action_hint": r.action_hint,
+            "model_id": getattr(r, "model_id", "unknown"),
+            "decision_ts": str(r.decision_ts),
+            "explanation": getattr(r, "explanation", ""),
+        })
+
+    # Webhook posts are independent network calls; send them concurrently
+    with ThreadPoolExecutor(max_workers=ALERT_WEBHOOK_WORKERS) as pool:
+        sent = np.fromiter(pool.map(post_webhook, payloads), dtype=np.uint8, count=len(payloads))
+    for payload, ok in zip(payloads, sent):
+        if not ok:
+            log.info("alert", **payload)
+
+    df["sent"] = sent
+    df["dest"] = np.where(sent == 1, "webhook", "stdout")
+    return df[ALERT_COLUMNS].astype(ALERT_DTYPES)
+
+
+def insert_alerts(alerts: pd.DataFrame):
+    insert_df("fxai.alerts", alerts)
+
 
 def loop():
     log.info("alerter_start", poll_sec=ALERT_POLL_SEC, lookback_min=ALERT_LOOKBACK_MIN)
@@ -104,42 +186,13 @@ def loop():
             log.info("alerter_poll", fetched=len(df))
             if not df.empty:
                 log.info("alerter_preview", head=df.head(3).to_dict(orient="records"))
-                out_rows: list[tuple] = []
-                for _, r in df.iterrows():
-                    direction, hint = infer_direction_and_hint(
-                        r["pair"], float(r["prob_up"]), float(r["expected_delta_bps"]))
-                    payload = {
-                        "pair": r["pair"],
-                        "h": r["horizon"],
-                        "prob_up": float(r["prob_up"]),
-                        "expected_delta_bps": float(r["expected_delta_bps"]),
-                        "direction": direction,
-                        "action_hint": hint,
-                        "model_id": r.get("model_id", "unknown"),
-                        "decision_ts": str(r["decision_ts"]),
-                        "explanation": r.get("explanation", ""),
-                    }
-                    sent = 1 if post_webhook(payload) else 0
-                    dest = "webhook" if sent else "stdout"
-                    if not sent:
-                        log.info("alert", **payload)
-
-                    out_rows.append((
-                       
-                        r["decision_ts"], r["pair"], r["horizon"],
-                        float(r["prob_up"]), float(r["expected_delta_bps"]),
-                        "NOW", direction, hint, r.get("model_id", "unknown"),
-                        r.get("explanation", ""),
-                        0,  # embargo_applied (not evaluated here)
-                        sent, dest,
-                    ))
-                if out_rows:
-                    try:
-                        log.info("alerter_inserting", rows=len(out_rows))
-                        insert_alert_rows(out_rows)
-                        log.info("alerter_insert_ok", rows=len(out_rows))
-                    except Exception:
-                        log.exception("alerter_insert_error", rows=len(out_rows), sample=out_rows[0] if out_rows else None)
+                alerts = build_alerts(df)
+                try:
+                    log.info("alerter_inserting", rows=len(alerts))
+                    insert_alerts(alerts)
+                    log.info("alerter_insert_ok", rows=len(alerts))
+                except Exception:
+                    log.exception("alerter_insert_error", rows=len(alerts), sample=alerts.iloc[0].to_dict())
             else:
                 log.debug("alerter_no_new")
         except Exception:
@@ -153,37 +206,13 @@ def run_once():
         log.info("alerter_poll_once", fetched=len(df))
         if df.empty:
             return
-        out_rows: list[tuple] = []
-        for _, r in df.iterrows():
-            direction, hint = infer_direction_and_hint(
-                r["pair"], float(r["prob_up"]), float(r["expected_delta_bps"]))
-            payload = {
-                "pair": r["pair"],
-                "h": r["horizon"],
-                "prob_up": float(r["prob_up"]),
-                "expected_delta_bps": float(r["expected_delta_bps"]),
-                "direction": direction,
-                "action_hint": hint,
-                "model_id": r.get("model_id", "unknown"),
-                "decision_ts": str(r["decision_ts"]),
-                "explanation": r.get("explanation", ""),
-            }
-            sent = 1 if post_webhook(payload) else 0
-            dest = "webhook" if sent else "stdout"
-            if not sent:
-                log.info("alert", **payload)
-            out_rows.append((
-                r["decision_ts"], r["pair"], r["horizon"],
-                float(r["prob_up"]), float(r["expected_delta_bps"]),
-                "NOW", direction, hint, r.get("model_id", "unknown"),
-                r.get("explanation", ""), 0, sent, dest,
-            ))
+        alerts = build_alerts(df)
         try:
-            log.info("alerter_inserting_once", rows=len(out_rows))
-            insert_alert_rows(out_rows)
-            log.info("alerter_insert_ok_once", rows=len(out_rows))
+            log.info("alerter_inserting_once", rows=len(alerts))
+            insert_alerts(alerts)
+            log.info("alerter_insert_ok_once", rows=len(alerts))
         except Exception:
-            log.exception("alerter_insert_error_once", rows=len(out_rows), sample=out_rows[0] if out_rows else None)
+            log.exception("alerter_insert_error_once", rows=len(alerts), sample=alerts.iloc[0].to_dict())
     except Exception:
         log.exception("alerter_once_error")
 
@@ -3,16 +3,18 @@ import os
 import time
 import signal
 import argparse
-from typing import List
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
 
 from apps.features.featurize import build_features
 from apps.common.clickhouse_client import insert_df
 
-RUNNING = True
+STOP = threading.Event()
 
 def _handle_signal(signum, frame):
-    global RUNNING
-    RUNNING = False
+    STOP.set()
 
 for sig in (signal.SIGINT, signal.SIGTERM):
     signal.signal(sig, _handle_signal)
@@ -29,11 +31,32 @@ def parse_args():
     return ap.parse_args()
 
 
-def run_once(pairs: List[str], lookback_minutes: int) -> int:
+def _featurize_one(pair: str, lookback_minutes: int):
+    """Build features for one pair; runs in a worker process, so errors come back as text."""
+    try:
+        return build_features(pair.strip().upper(), lookback_minutes), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _new_executor(pairs: List[str]) -> Optional[Executor]:
+    if len(pairs) <= 1:
+        return None
+    return ProcessPoolExecutor(max_workers=min(len(pairs), os.cpu_count() or 1))
+
+
+def run_once(pairs: List[str], lookback_minutes: int, executor: Optional[Executor] = None) -> int:
     total_inserted = 0
-    for pair in pairs:
+    # Pairs are independent and CPU-bound, so build them in parallel; inserts stay in this process
+    if executor is not None:
+        results = executor.map(_featurize_one, pairs, [lookback_minutes] * len(pairs))
+    else:
+        results = (_featurize_one(pair, lookback_minutes) for pair in pairs)
+    for pair, (feats, err) in zip(pairs, results):
+        if err is not None:
+            print(f"[featurizer][error] pair={pair} {err}")
+            continue
         try:
-            feats = build_features(pair.strip().upper(), lookback_minutes)
             if feats is not None and not feats.empty:
                 insert_df("fxai.features_1m", feats)
                 total_inserted += len(feats)
@@ -55,13 +78,24 @@ def main():
     # slight initial delay to avoid aligning exactly on the minute boundary
     time.sleep(2)
 
-    while RUNNING:
-        inserted = run_once(pairs, args.lookback_minutes)
-        # sleep regardless of success/failure; allow graceful shutdown
-        for _ in range(interval):
-            if not RUNNING:
-                break
-            time.sleep(1)
+    executor = _new_executor(pairs)
+
+    try:
+        while not STOP.is_set():
+            try:
+                inserted = run_once(pairs, args.lookback_minutes, executor)
+            except Exception as e:
+                print(f"[featurizer][error] run failed {type(e).__name__}: {e}")
+                if isinstance(e, BrokenProcessPool):
+                    # A worker died (e.g. OOM-killed); the pool is unusable, so start a fresh one
+                    executor.shutdown(wait=False)
+                    executor = _new_executor(pairs)
+                    print("[featurizer] worker pool restarted")
+            # sleep regardless of success/failure; a shutdown signal ends the wait early
+            STOP.wait(timeout=interval)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     print("[featurizer] shutting down")
 
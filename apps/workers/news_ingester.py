@@ -7,25 +7,59 @@ Optionally triggers LLM sentiment analysis for high-priority news.
 from __future__ import annotations
 import os
 import time
+import hashlib
 import signal
 import asyncio
 import argparse
+import dataclasses
+from operator import attrgetter
+from string import Template
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import List
 import structlog
 
-from apps.news.sources import NewsItem, NewsSource, create_default_sources
+try:
+    import uvloop  # optional (faster event loop)
+except Exception:  # pragma: no cover
+    uvloop = None
+
+from apps.news.sources import (NewsItem, NewsSource, BloomDedup, create_default_sources,
+                               fetch_all_sources)
 from apps.news.advanced_sources import create_advanced_sources
-from apps.common.clickhouse_client import insert_rows
+from apps.common.clickhouse_client import insert_rows, ASYNC_INSERT_SETTINGS
 from apps.llm.client import get_llm_client, SentimentResult
 
 log = structlog.get_logger()
 
 RUNNING = True
+# Set on shutdown so run_continuous wakes from its between-cycle wait immediately
+_stop_event: asyncio.Event | None = None
+_stop_loop: asyncio.AbstractEventLoop | None = None
+
+SENTIMENT_COLUMNS = (
+    "news_id", "ts", "model_version",
+    "sentiment_overall", "sentiment_usd", "sentiment_inr",
+    "sentiment_eur", "sentiment_gbp", "sentiment_jpy",
+    "confidence", "impact_score", "urgency",
+    "currencies", "countries", "institutions", "topics",
+    "explanation", "key_phrases",
+    "processing_time_ms", "tokens_used", "api_cost_usd"
+)
+
+NEWS_COLUMNS = ["id", "ts", "source", "headline", "content", "url", "author", "language", "raw_json"]
+NEWS_CONTENT_MAX = 10000  # Truncate very long content
+NEWS_RAW_JSON_MAX = 5000  # Truncate raw JSON
+
+# Field reader for the sentiment row builder: one C-level call per result
+_sentiment_fields = attrgetter(*SENTIMENT_COLUMNS[2:])
 
 
 def _handle_signal(signum, frame):
     global RUNNING
     RUNNING = False
+    if _stop_event is not None:
+        _stop_loop.call_soon_threadsafe(_stop_event.set)
     log.info("shutdown_signal_received", signal=signum)
 
 
@@ -33,6 +67,71 @@ for sig in (signal.SIGINT, signal.SIGTERM):
     signal.signal(sig, _handle_signal)
 
 
+def _content_key(item: NewsItem) -> str:
+    """Key for reusing sentiment across sources that republish the same story."""
+    text = item.headline + item.content[:500]
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _reused(result):
+    """A sentiment result served again without an LLM call: same scores, no cost."""
+    if isinstance(result, Exception):
+        return result
+    return dataclasses.replace(result, api_cost_usd=0.0, tokens_used=0, processing_time_ms=0)
+
+
+async def _ainsert(*args, **kwargs) -> None:
+    """insert_rows on a worker thread, so the event loop keeps serving fetches meanwhile."""
+    return await asyncio.to_thread(insert_rows, *args, **kwargs)
+
+
+# news_items row builder, generated once for the fixed schema so the per-item hot path
+# is straight-line code with the truncation limits inlined as constants. Timestamps stay
+# datetime objects; clickhouse-connect encodes them for DateTime64 natively.
+_NEWS_ROW_SRC = Template("""\
+def _news_row(item):
+    c = item.content
+    if c is not None and len(c) > $content_max:
+        c = c[:$content_max]
+    rj = item.raw_json
+    if not rj:
+        rj = ""
+    elif len(rj) > $raw_json_max:
+        rj = rj[:$raw_json_max]
+    return (item.id, item.ts, item.source, item.headline,
+            c, item.url, item.author, item.language, rj)
+""")
+
+
+def _compile_news_row():
+    ns = {}
+    exec(_NEWS_ROW_SRC.substitute(content_max=NEWS_CONTENT_MAX, raw_json_max=NEWS_RAW_JSON_MAX), ns)
+    fn = ns["_news_row"]
+    fn.__doc__ = "Convert NewsItem to a fxai.news_items row."
+    return fn
+
+
+_news_row = _compile_news_row()
+
+
+class AsyncRateLimiter:
+    """Spaces out entries to at most `rate_per_minute`, evenly, across concurrent tasks."""
+    
+    def __init__(self, rate_per_minute: float):
+        self._interval = 60.0 / rate_per_minute
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+    
+    async def acquire(self):
+        """Wait until the next slot is free."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_at - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_at = max(now, self._next_at) + self._interval
+
+
 class NewsIngester:
     """News ingestion worker."""
     
@@ -40,8 +139,11 @@ class NewsIngester:
                  sources: List[NewsSource],
                  poll_interval_seconds: int = 60,
                  lookback_hours: int = 1,
+                 fetch_concurrency: int = 8,
                  enable_sentiment: bool = True,
-                 sentiment_batch_size: int = 5):
+                 sentiment_batch_size: int = 5,
+                 sentiment_concurrency: int = 3,
+                 sentiment_rate_per_minute: float = 120):
         """
         Initialize news ingester.
         
@@ -49,14 +151,28 @@ class NewsIngester:
             sources: List of news sources to poll
             poll_interval_seconds: Seconds between polling cycles
             lookback_hours: How far back to fetch news
+            fetch_concurrency: Max sources fetched at the same time
             enable_sentiment: Whether to run LLM sentiment analysis
             sentiment_batch_size: Max items to analyze per cycle
+            sentiment_concurrency: Max LLM sentiment calls in flight at once
+            sentiment_rate_per_minute: Max LLM sentiment calls started per minute
         """
         self.sources = sources
         self.poll_interval = poll_interval_seconds
+        # Back off (doubling, up to 8x) while cycles insert nothing; reset on new news
+        self._min_interval = poll_interval_seconds
+        self._max_interval = poll_interval_seconds * 8
+        self._empty_streak = 0
         self.lookback_hours = lookback_hours
+        self.fetch_concurrency = fetch_concurrency
         self.enable_sentiment = enable_sentiment
         self.sentiment_batch_size = sentiment_batch_size
+        self.sentiment_concurrency = sentiment_concurrency
+        self._sentiment_sem = asyncio.Semaphore(sentiment_concurrency)
+        self._sentiment_limiter = AsyncRateLimiter(sentiment_rate_per_minute)
+        # Recent sentiment results by story content (LRU), to skip repeat LLM calls
+        self._sentiment_cache: OrderedDict[str, SentimentResult] = OrderedDict()
+        self._sentiment_cache_cap = 2048
         
         # Initialize LLM client if sentiment enabled
         self.llm_client = None
@@ -68,9 +184,9 @@ class NewsIngester:
                 log.warning("llm_client_init_failed", error=str(e))
                 self.enable_sentiment = False
         
-        # Track seen news IDs to avoid duplicates
-        self.seen_ids = set()
-        self.max_seen_ids = 10000  # Prevent unbounded growth
+        # Track seen news IDs to avoid duplicates (sliding-window Bloom filter, ~24 KB per generation)
+        self.max_seen_ids = 10000
+        self.seen_ids = BloomDedup(capacity=self.max_seen_ids, fpr=1e-4)
     
     async def run_once(self) -> dict:
         """
@@ -87,16 +203,17 @@ class NewsIngester:
             "errors": 0
         }
         
-        # Fetch from all sources
+        # Fetch from all sources concurrently
         all_items = []
-        for source in self.sources:
-            try:
-                items = await source.fetch_latest(self.lookback_hours)
-                all_items.extend(items)
-                stats["news_fetched"] += len(items)
-            except Exception as e:
-                log.error("source_fetch_error", source=source.source_name, error=str(e))
+        results = await fetch_all_sources(self.sources, self.lookback_hours,
+                                          concurrency=self.fetch_concurrency)
+        for source, result in zip(self.sources, results):
+            if isinstance(result, Exception):
+                log.error("source_fetch_error", source=source.source_name, error=str(result))
                 stats["errors"] += 1
+                continue
+            all_items.extend(result)
+            stats["news_fetched"] += len(result)
         
         if not all_items:
             log.info("no_news_fetched")
@@ -105,16 +222,10 @@ class NewsIngester:
         # Deduplicate
         unique_items = []
         for item in all_items:
-            if item.id not in self.seen_ids:
-                unique_items.append(item)
-                self.seen_ids.add(item.id)
-            else:
+            if self.seen_ids.contains_and_add(item.id):
                 stats["news_duplicate"] += 1
-        
-        # Trim seen_ids if too large
-        if len(self.seen_ids) > self.max_seen_ids:
-            # Keep most recent half
-            self.seen_ids = set(list(self.seen_ids)[-self.max_seen_ids // 2:])
+            else:
+                unique_items.append(item)
         
         if not unique_items:
             log.info("all_news_duplicate", count=len(all_items))
@@ -122,11 +233,12 @@ class NewsIngester:
         
         # Insert news items into database
         try:
-            rows = [self._news_item_to_row(item) for item in unique_items]
-            insert_rows(
+            rows = list(map(_news_row, unique_items))
+            await _ainsert(
                 "fxai.news_items",
                 rows,
-                ["id", "ts", "source", "headline", "content", "url", "author", "language", "raw_json"]
+                NEWS_COLUMNS,
+                settings=ASYNC_INSERT_SETTINGS
             )
             stats["news_inserted"] = len(rows)
             log.info("news_inserted", count=len(rows))
@@ -141,90 +253,102 @@ class NewsIngester:
         return stats
     
     async def _analyze_sentiment(self, items: List[NewsItem], stats: dict):
-        """Analyze sentiment for news items."""
-        for item in items:
-            try:
-                result = await self.llm_client.analyze_sentiment(
+        """Analyze sentiment for news items concurrently (bounded and rate limited)."""
+        async def _one(item: NewsItem):
+            async with self._sentiment_sem:
+                await self._sentiment_limiter.acquire()
+                return await self.llm_client.analyze_sentiment(
                     headline=item.headline,
                     content=item.content,
                     source=item.source,
                     timestamp=item.ts
                 )
-                
-                # Insert sentiment score
-                row = self._sentiment_result_to_row(item.id, result)
-                insert_rows(
-                    "fxai.sentiment_scores",
-                    [row],
-                    [
-                        "news_id", "ts", "model_version",
-                        "sentiment_overall", "sentiment_usd", "sentiment_inr",
-                        "sentiment_eur", "sentiment_gbp", "sentiment_jpy",
-                        "confidence", "impact_score", "urgency",
-                        "currencies", "countries", "institutions", "topics",
-                        "explanation", "key_phrases",
-                        "processing_time_ms", "tokens_used", "api_cost_usd"
-                    ]
-                )
-                
-                stats["sentiment_analyzed"] += 1
-                log.info("sentiment_analyzed",
-                        news_id=item.id,
-                        sentiment=result.sentiment_overall,
-                        impact=result.impact_score,
-                        cost=result.api_cost_usd)
-                
-                # Small delay to avoid rate limits
-                await asyncio.sleep(0.5)
-            
-            except Exception as e:
-                log.error("sentiment_analysis_error", news_id=item.id, error=str(e))
+        
+        # Reuse cached results for stories already scored; call the LLM once per new story
+        keys = [_content_key(item) for item in items]
+        resolved = {}
+        pending = {}
+        for item, key in zip(items, keys):
+            if key in self._sentiment_cache:
+                self._sentiment_cache.move_to_end(key)
+                resolved[key] = self._sentiment_cache[key]
+            elif key not in pending:
+                pending[key] = item
+        
+        fetched = dict(zip(pending, await asyncio.gather(*map(_one, pending.values()),
+                                                         return_exceptions=True)))
+        for key, result in fetched.items():
+            # Clients report failures as zero-confidence results; never cache those
+            if not isinstance(result, Exception) and result.confidence > 0:
+                self._sentiment_cache[key] = _reused(result)
+                if len(self._sentiment_cache) > self._sentiment_cache_cap:
+                    self._sentiment_cache.popitem(last=False)
+        
+        # Only the item that triggered the LLM call carries its cost; copies are free
+        results = []
+        for item, key in zip(items, keys):
+            if key in resolved:
+                results.append(resolved[key])
+            elif pending[key] is item:
+                results.append(fetched[key])
+            else:
+                results.append(_reused(fetched[key]))
+        if len(pending) < len(items):
+            log.info("sentiment_cache_reused", count=len(items) - len(pending))
+        
+        # One scoring timestamp for the whole batch
+        cycle_ts = datetime.now(timezone.utc)
+        sentiment_rows = []
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                log.error("sentiment_analysis_error", news_id=item.id, error=str(result))
                 stats["errors"] += 1
+                continue
+            
+            sentiment_rows.append(self._sentiment_result_to_row(item.id, result, cycle_ts))
+            
+            stats["sentiment_analyzed"] += 1
+            log.info("sentiment_analyzed",
+                    news_id=item.id,
+                    sentiment=result.sentiment_overall,
+                    impact=result.impact_score,
+                    cost=result.api_cost_usd)
+        
+        # One insert for the whole cycle
+        if sentiment_rows:
+            await self._insert_sentiment_rows(sentiment_rows, stats)
     
-    def _news_item_to_row(self, item: NewsItem) -> tuple:
-        """Convert NewsItem to database row."""
-        return (
-            item.id,
-            item.ts.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-            item.source,
-            item.headline,
-            item.content[:10000],  # Truncate very long content
-            item.url,
-            item.author,
-            item.language,
-            item.raw_json[:5000] if item.raw_json else ""  # Truncate raw JSON
-        )
-    
-    def _sentiment_result_to_row(self, news_id: str, result: SentimentResult) -> tuple:
+    async def _insert_sentiment_rows(self, rows: List[tuple], stats: dict):
+        """Insert sentiment score rows in a single batch."""
+        try:
+            await _ainsert(
+                "fxai.sentiment_scores",
+                rows,
+                SENTIMENT_COLUMNS,
+                settings=ASYNC_INSERT_SETTINGS
+            )
+        except Exception as e:
+            log.error("sentiment_insert_failed", count=len(rows), error=str(e))
+            stats["errors"] += 1
+    
+    def _sentiment_result_to_row(self, news_id: str, result: SentimentResult, ts: datetime) -> tuple:
         """Convert SentimentResult to database row."""
-        from datetime import datetime, timezone
-        
-        return (
-            news_id,
-            datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-            result.model_version,
-            result.sentiment_overall,
-            result.sentiment_usd,
-            result.sentiment_inr,
-            result.sentiment_eur,
-            result.sentiment_gbp,
-            result.sentiment_jpy,
-            result.confidence,
-            result.impact_score,
-            result.urgency,
-            result.currencies,
-            result.countries,
-            result.institutions,
-            result.topics,
-            result.explanation,
-            result.key_phrases,
-            result.processing_time_ms,
-            result.tokens_used,
-            result.api_cost_usd
-        )
+        return (news_id, ts) + _sentiment_fields(result)
+    
+    def _next_interval(self, stats: dict) -> int:
+        """Seconds to wait before the next cycle, given this cycle's stats."""
+        if stats["news_inserted"] == 0:
+            self._empty_streak += 1
+            return min(self._max_interval, self._min_interval * 2 ** self._empty_streak)
+        self._empty_streak = 0
+        return self._min_interval
     
     async def run_continuous(self):
         """Run continuous ingestion loop."""
+        global _stop_event, _stop_loop
+        _stop_event = asyncio.Event()
+        _stop_loop = asyncio.get_running_loop()
+        
         log.info("news_ingester_starting",
                 sources=len(self.sources),
                 poll_interval=self.poll_interval,
@@ -234,17 +358,20 @@ class NewsIngester:
         await asyncio.sleep(2)
         
         while RUNNING:
+            sleep_for = self._min_interval
             try:
                 stats = await self.run_once()
-                log.info("ingestion_cycle_complete", **stats)
+                sleep_for = self._next_interval(stats)
+                log.info("ingestion_cycle_complete", next_poll_sec=sleep_for, **stats)
             except Exception as e:
                 log.error("ingestion_cycle_error", error=str(e))
             
-            # Sleep until next cycle
-            for _ in range(self.poll_interval):
-                if not RUNNING:
-                    break
-                await asyncio.sleep(1)
+            # Sleep until next cycle, or until a shutdown signal
+            try:
+                await asyncio.wait_for(_stop_event.wait(), timeout=sleep_for)
+                break
+            except asyncio.TimeoutError:
+                pass
         
         log.info("news_ingester_shutdown")
 
@@ -261,6 +388,10 @@ def parse_args():
                    default=int(os.getenv("NEWS_LOOKBACK_HOURS", "1")),
                    help="Hours of news history to fetch")
     
+    ap.add_argument("--fetch-concurrency", type=int,
+                   default=int(os.getenv("NEWS_FETCH_CONCURRENCY", "8")),
+                   help="Max news sources fetched concurrently")
+    
     ap.add_argument("--enable-sentiment", action="store_true",
                    default=os.getenv("NEWS_ENABLE_SENTIMENT", "true").lower() == "true",
                    help="Enable LLM sentiment analysis")
@@ -269,6 +400,14 @@ def parse_args():
                    default=int(os.getenv("NEWS_SENTIMENT_BATCH_SIZE", "5")),
                    help="Max news items to analyze per cycle")
     
+    ap.add_argument("--sentiment-concurrency", type=int,
+                   default=int(os.getenv("NEWS_SENTIMENT_CONCURRENCY", "3")),
+                   help="Max concurrent LLM sentiment calls")
+    
+    ap.add_argument("--sentiment-rate-per-minute", type=float,
+                   default=float(os.getenv("NEWS_SENTIMENT_RATE_PER_MIN", "120")),
+                   help="Max LLM sentiment calls started per minute")
+    
     ap.add_argument("--newsapi-key", type=str,
                    default=os.getenv("NEWSAPI_KEY", ""),
                    help="NewsAPI.org API key")
@@ -340,12 +479,17 @@ async def main():
         sources=sources,
         poll_interval_seconds=args.poll_interval,
         lookback_hours=args.lookback_hours,
+        fetch_concurrency=args.fetch_concurrency,
         enable_sentiment=args.enable_sentiment,
-        sentiment_batch_size=args.sentiment_batch_size
+        sentiment_batch_size=args.sentiment_batch_size,
+        sentiment_concurrency=args.sentiment_concurrency,
+        sentiment_rate_per_minute=args.sentiment_rate_per_minute
     )
     
     await ingester.run_continuous()
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
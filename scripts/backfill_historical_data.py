@@ -8,9 +8,14 @@ to enable longer time range views in the dashboard.
 import sys
 sys.path.insert(0, '.')
 
+import os
+import asyncio
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import repeat
 from datetime import datetime, timedelta, timezone
-import random
+import numpy as np
+import pandas as pd
 from apps.common.clickhouse_client import insert_rows
 
 # Popular currency pairs with realistic price ranges
@@ -25,45 +30,51 @@ CURRENCY_PAIRS = {
     'NZDUSD': {'base': 0.59, 'volatility': 0.005},
 }
 
+BAR_COLUMNS = ["ts", "pair", "open", "high", "low", "close", "spread_avg", "src"]
 
-def generate_realistic_bar(pair: str, timestamp: datetime, prev_close: float = None):
-    """Generate a realistic OHLC bar with trend and noise."""
-    config = CURRENCY_PAIRS[pair]
-    base_price = config['base']
-    volatility = config['volatility']
-    
-    if prev_close is None:
-        prev_close = base_price
-    
-    # Add trend (slight upward bias)
-    trend = random.uniform(-0.0001, 0.0002) * prev_close
-    
-    # Add random walk
-    change = random.gauss(0, volatility)
-    close = prev_close + trend + change
+
+def generate_bars(pair: str, start_time: datetime, n: int, prev_close: float,
+                  rng: np.random.Generator) -> list:
+    """Generate `n` consecutive 1-minute bars starting at `start_time` after `prev_close`."""
+    volatility = CURRENCY_PAIRS[pair]['volatility']
+    
+    # Each bar: close = prev_close * (1 + trend) + change, with trend giving a slight
+    # upward bias and change a random walk. The recurrence is linear, so it is solved
+    # in closed form: with growth = cumprod(1 + trend), close = growth * (prev + cumsum(change / growth))
+    trend = rng.uniform(-0.0001, 0.0002, n)
+    change = rng.normal(0, volatility, n)
+    growth = np.cumprod(1.0 + trend)
+    closes = growth * (prev_close + np.cumsum(change / growth))
+    opens = np.concatenate(([prev_close], closes[:-1]))
     
     # Generate OHLC
-    high_offset = abs(random.gauss(0, volatility * 0.5))
-    low_offset = abs(random.gauss(0, volatility * 0.5))
-    
-    open_price = prev_close
-    high = max(open_price, close) + high_offset
-    low = min(open_price, close) - low_offset
+    high_offset = np.abs(rng.normal(0, volatility * 0.5, n))
+    low_offset = np.abs(rng.normal(0, volatility * 0.5, n))
+    highs = np.maximum(opens, closes) + high_offset
+    lows = np.minimum(opens, closes) - low_offset
     
     # Spread (typical FX spread in pips)
-    spread_avg = random.uniform(0.0001, 0.0003) * close
-    
-    return {
-        'open': open_price,
-        'high': high,
-        'low': low,
-        'close': close,
-        'spread_avg': spread_avg
-    }
+    spreads = rng.uniform(0.0001, 0.0003, n) * closes
+    
+    timestamps = pd.date_range(start_time, periods=n, freq="min").to_pydatetime()
+    return list(zip(
+        timestamps.tolist(),
+        repeat(pair, n),
+        opens.tolist(),
+        highs.tolist(),
+        lows.tolist(),
+        closes.tolist(),
+        spreads.tolist(),
+        repeat('backfill', n),
+    ))
 
 
 def backfill_pair(pair: str, days: int = 30):
     """Backfill historical data for a currency pair."""
+    asyncio.run(_backfill_pair(pair, days))
+
+
+async def _backfill_pair(pair: str, days: int):
     print(f"\n{'='*60}")
     print(f"Backfilling {pair} - Last {days} days")
     print(f"{'='*60}")
@@ -79,52 +90,41 @@ def backfill_pair(pair: str, days: int = 30):
     print(f"End: {end_time}")
     print(f"Total bars: {total_bars:,}")
     
-    rows = []
-    current_time = start_time
-    prev_close = CURRENCY_PAIRS[pair]['base']
-    
-    print("Generating bars...")
-    for i in range(total_bars):
-        bar = generate_realistic_bar(pair, current_time, prev_close)
-        
-        rows.append((
-            current_time,
-            pair,
-            bar['open'],
-            bar['high'],
-            bar['low'],
-            bar['close'],
-            bar['spread_avg'],
-            'backfill'
-        ))
-        
-        prev_close = bar['close']
-        current_time += timedelta(minutes=1)
-        
-        # Progress indicator
-        if (i + 1) % 10000 == 0:
-            print(f"  Generated {i+1:,}/{total_bars:,} bars ({(i+1)/total_bars*100:.1f}%)")
-    
-    print(f"\n✓ Generated {len(rows):,} bars")
-    
-    # Insert in batches
+    # Generate the next batch while the previous one is being inserted; the bounded
+    # queue keeps at most a few batches in memory
     batch_size = 10000
-    print(f"Inserting into ClickHouse (batch size: {batch_size:,})...")
+    num_batches = (total_bars - 1) // batch_size + 1
+    print(f"Generating and inserting into ClickHouse (batch size: {batch_size:,})...")
     
-    for i in range(0, len(rows), batch_size):
-        batch = rows[i:i+batch_size]
-        insert_rows(
-            "fxai.bars_1m",
-            batch,
-            ["ts", "pair", "open", "high", "low", "close", "spread_avg", "src"]
-        )
-        print(f"  Inserted batch {i//batch_size + 1}/{(len(rows)-1)//batch_size + 1}")
-    
-    print(f"✓ Inserted {len(rows):,} bars for {pair}")
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+    rng = np.random.default_rng()
+    prev_close = CURRENCY_PAIRS[pair]['base']
+    first_close = None
+    
+    async def produce():
+        nonlocal prev_close, first_close
+        for i in range(0, total_bars, batch_size):
+            batch = generate_bars(pair, start_time + timedelta(minutes=i),
+                                  min(batch_size, total_bars - i), prev_close, rng)
+            if first_close is None:
+                first_close = batch[0][5]
+            prev_close = batch[-1][5]
+            await queue.put(batch)
+        await queue.put(None)
+    
+    async def consume():
+        done = 0
+        while (batch := await queue.get()) is not None:
+            await asyncio.to_thread(insert_rows, "fxai.bars_1m", batch, BAR_COLUMNS)
+            done += 1
+            print(f"  Inserted batch {done}/{num_batches}")
+    
+    await asyncio.gather(produce(), consume())
+    
+    print(f"✓ Inserted {total_bars:,} bars for {pair}")
     
     # Show price range
-    first_close = rows[0][5]
-    last_close = rows[-1][5]
+    last_close = prev_close
     change_pct = ((last_close - first_close) / first_close) * 100
     
     print(f"\nPrice Summary:")
@@ -151,12 +151,14 @@ def main():
     print(f"Bars per pair: {args.days * 24 * 60:,}")
     print("="*60)
     
-    for pair in args.pairs:
-        try:
-            backfill_pair(pair, args.days)
-        except Exception as e:
-            print(f"✗ Error backfilling {pair}: {e}")
-            continue
+    # Pairs are independent; each worker process opens its own ClickHouse connection
+    with ProcessPoolExecutor(max_workers=min(len(args.pairs), os.cpu_count() or 1)) as ex:
+        futures = {ex.submit(backfill_pair, pair, args.days): pair for pair in args.pairs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"✗ Error backfilling {futures[future]}: {e}")
     
     print("\n" + "="*60)
     print("✅ Backfill Complete!")
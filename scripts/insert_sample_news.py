@@ -53,8 +53,8 @@ async def insert_and_analyze():
     print("=" * 60)
     print()
     
-    # Create news items
-    news_items = []
+    # Create news items (count is known up front, so fill a preallocated list)
+    news_items = [None] * len(SAMPLE_NEWS)
     now = datetime.now(timezone.utc)
     
     for i, sample in enumerate(SAMPLE_NEWS):
@@ -68,7 +68,7 @@ async def insert_and_analyze():
             source=sample["source"],
             ts=ts
         )
-        news_items.append(item)
+        news_items[i] = item
         print(f"✓ Created: {item.headline[:60]}...")
     
     # Insert into database
@@ -77,7 +77,7 @@ async def insert_and_analyze():
     rows = [
         (
             item.id,
-            item.ts.strftime('%Y-%m-%d %H:%M:%S'),
+            item.ts,
             item.source,
             item.headline,
             item.content,
@@ -113,7 +113,7 @@ async def insert_and_analyze():
             
             sentiment_rows.append((
                 item.id,
-                item.ts.strftime('%Y-%m-%d %H:%M:%S'),
+                item.ts,
                 result.sentiment,
                 result.score,
                 result.confidence,
@@ -6,8 +6,11 @@ Tests the enhanced /v1/forecast endpoint with news sentiment fusion.
 """
 import sys
 import json
+import socket
 import httpx
 import asyncio
+from contextvars import ContextVar
+from urllib.parse import urlparse
 from datetime import datetime
 
 # Configuration
@@ -15,31 +18,72 @@ API_BASE_URL = "http://localhost:9090"
 API_KEY = "changeme-dev-key"  # Update if you changed it in .env
 
 
-async def test_health():
+# Output buffer of the running test (None: print directly). Tests that run concurrently
+# each get their own buffer, so their output can be printed as whole blocks in order.
+_OUTPUT: ContextVar = ContextVar("test_output", default=None)
+
+
+def out(*args):
+    buf = _OUTPUT.get()
+    if buf is None:
+        print(*args)
+    else:
+        buf.append(" ".join(map(str, args)))
+
+
+async def run_buffered(test, client: httpx.AsyncClient):
+    """Run `test` with its output captured; returns (passed, output lines)."""
+    lines = []
+    _OUTPUT.set(lines)  # gather runs each test in its own task, so this stays local
+    try:
+        return await test(client), lines
+    except Exception as e:
+        # A crashing test fails on its own; the others' output and the summary still print
+        out(f"✗ Error: {type(e).__name__}: {e}")
+        return False, lines
+
+
+def resolve_base_url(url: str):
+    """
+    Resolve the API host once and return (base URL with the IP, Host header).
+    
+    Plain HTTP only: with HTTPS the hostname is needed for SNI and certificate
+    checks, so the URL is returned unchanged (as it is if resolution fails).
+    """
+    parsed = urlparse(url)
+    if parsed.scheme != "http" or not parsed.hostname:
+        return url, None
+    try:
+        ip = socket.gethostbyname(parsed.hostname)
+    except OSError:
+        return url, None
+    return f"http://{ip}:{parsed.port or 80}", parsed.netloc
+
+
+async def test_health(client: httpx.AsyncClient):
     """Test health endpoint."""
-    print("\n" + "="*60)
-    print("TEST 1: Health Check")
-    print("="*60)
+    out("\n" + "="*60)
+    out("TEST 1: Health Check")
+    out("="*60)
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{API_BASE_URL}/health")
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✓ API is healthy")
-            print(f"  Status: {data['status']}")
-            print(f"  Environment: {data['env']}")
-            return True
-        else:
-            print(f"✗ Health check failed: {response.status_code}")
-            return False
+    response = await client.get("/health")
+    
+    if response.status_code == 200:
+        data = response.json()
+        out(f"✓ API is healthy")
+        out(f"  Status: {data['status']}")
+        out(f"  Environment: {data['env']}")
+        return True
+    else:
+        out(f"✗ Health check failed: {response.status_code}")
+        return False
 
 
-async def test_ml_only_forecast():
+async def test_ml_only_forecast(client: httpx.AsyncClient):
     """Test ML-only forecast (hybrid disabled)."""
-    print("\n" + "="*60)
-    print("TEST 2: ML-Only Forecast")
-    print("="*60)
+    out("\n" + "="*60)
+    out("TEST 2: ML-Only Forecast")
+    out("="*60)
     
     params = {
         "pair": "USDINR",
@@ -47,39 +91,34 @@ async def test_ml_only_forecast():
         "use_hybrid": False  # Explicitly disable hybrid
     }
     
-    headers = {"X-API-Key": API_KEY}
+    response = await client.get(
+        "/v1/forecast",
+        params=params
+    )
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{API_BASE_URL}/v1/forecast",
-            params=params,
-            headers=headers,
-            timeout=10.0
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✓ ML-only forecast received")
-            print(f"  Pair: {data['pair']}")
-            print(f"  Horizon: {data['horizon']}")
-            print(f"  Probability Up: {data['prob_up']:.3f}")
-            print(f"  Expected Delta: {data['expected_delta_bps']:+.2f} bps")
-            print(f"  Recommendation: {data['recommendation']}")
-            print(f"  Model: {data['model_id']}")
-            print(f"  Direction: {data['direction']}")
-            print(f"  Hybrid Enabled: {data['hybrid']['enabled']}")
-            return True
-        else:
-            print(f"✗ Forecast failed: {response.status_code}")
-            print(f"  Error: {response.text}")
-            return False
+    if response.status_code == 200:
+        data = response.json()
+        out(f"✓ ML-only forecast received")
+        out(f"  Pair: {data['pair']}")
+        out(f"  Horizon: {data['horizon']}")
+        out(f"  Probability Up: {data['prob_up']:.3f}")
+        out(f"  Expected Delta: {data['expected_delta_bps']:+.2f} bps")
+        out(f"  Recommendation: {data['recommendation']}")
+        out(f"  Model: {data['model_id']}")
+        out(f"  Direction: {data['direction']}")
+        out(f"  Hybrid Enabled: {data['hybrid']['enabled']}")
+        return True
+    else:
+        out(f"✗ Forecast failed: {response.status_code}")
+        out(f"  Error: {response.text}")
+        return False
 
 
-async def test_hybrid_forecast():
+async def test_hybrid_forecast(client: httpx.AsyncClient):
     """Test hybrid ML+LLM forecast."""
-    print("\n" + "="*60)
-    print("TEST 3: Hybrid ML+LLM Forecast")
-    print("="*60)
+    out("\n" + "="*60)
+    out("TEST 3: Hybrid ML+LLM Forecast")
+    out("="*60)
     
     params = {
         "pair": "USDINR",
@@ -87,165 +126,163 @@ async def test_hybrid_forecast():
         "use_hybrid": True  # Explicitly enable hybrid
     }
     
-    headers = {"X-API-Key": API_KEY}
+    response = await client.get(
+        "/v1/forecast",
+        params=params
+    )
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{API_BASE_URL}/v1/forecast",
-            params=params,
-            headers=headers,
-            timeout=10.0
-        )
+    if response.status_code == 200:
+        data = response.json()
+        out(f"✓ Hybrid forecast received")
+        out(f"  Pair: {data['pair']}")
+        out(f"  Horizon: {data['horizon']}")
+        out(f"  Probability Up: {data['prob_up']:.3f}")
+        out(f"  Expected Delta: {data['expected_delta_bps']:+.2f} bps")
+        out(f"  Recommendation: {data['recommendation']}")
+        out(f"  Direction: {data['direction']}")
         
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✓ Hybrid forecast received")
-            print(f"  Pair: {data['pair']}")
-            print(f"  Horizon: {data['horizon']}")
-            print(f"  Probability Up: {data['prob_up']:.3f}")
-            print(f"  Expected Delta: {data['expected_delta_bps']:+.2f} bps")
-            print(f"  Recommendation: {data['recommendation']}")
-            print(f"  Direction: {data['direction']}")
+        # Hybrid-specific info
+        hybrid = data.get('hybrid', {})
+        if hybrid.get('enabled'):
+            out(f"\n  🔄 HYBRID FUSION APPLIED:")
+            out(f"    ML Probability: {hybrid['prob_up_ml']:.3f}")
+            out(f"    Hybrid Probability: {hybrid['prob_up_hybrid']:.3f}")
+            out(f"    Adjustment: {hybrid['prob_up_hybrid'] - hybrid['prob_up_ml']:+.3f}")
+            out(f"    ML Delta: {hybrid['expected_delta_ml']:+.2f} bps")
+            out(f"    Hybrid Delta: {hybrid['expected_delta_hybrid']:+.2f} bps")
+            out(f"    Fusion Weights: ML={hybrid['fusion_weights']['ml']:.0%}, News={hybrid['fusion_weights']['llm']:.0%}")
             
-            # Hybrid-specific info
-            hybrid = data.get('hybrid', {})
-            if hybrid.get('enabled'):
-                print(f"\n  🔄 HYBRID FUSION APPLIED:")
-                print(f"    ML Probability: {hybrid['prob_up_ml']:.3f}")
-                print(f"    Hybrid Probability: {hybrid['prob_up_hybrid']:.3f}")
-                print(f"    Adjustment: {hybrid['prob_up_hybrid'] - hybrid['prob_up_ml']:+.3f}")
-                print(f"    ML Delta: {hybrid['expected_delta_ml']:+.2f} bps")
-                print(f"    Hybrid Delta: {hybrid['expected_delta_hybrid']:+.2f} bps")
-                print(f"    Fusion Weights: ML={hybrid['fusion_weights']['ml']:.0%}, News={hybrid['fusion_weights']['llm']:.0%}")
-                
-                if hybrid.get('news_sentiment') is not None:
-                    print(f"\n  📰 NEWS SENTIMENT:")
-                    print(f"    Sentiment Score: {hybrid['news_sentiment']:+.2f}")
-                    print(f"    Confidence: {hybrid['news_confidence']:.2f}")
-                    print(f"    Impact: {hybrid['news_impact']:.1f}/10")
-                    print(f"    Summary: {hybrid['news_summary']}")
-            else:
-                print(f"\n  ℹ️  Hybrid mode enabled but no news sentiment available")
-            
-            print(f"\n  📝 Explanation:")
-            for part in data['explanation']:
-                print(f"    - {part}")
-            
-            print(f"\n  💡 Action Hint:")
-            print(f"    {data['action_hint']}")
-            
-            return True
+            if hybrid.get('news_sentiment') is not None:
+                out(f"\n  📰 NEWS SENTIMENT:")
+                out(f"    Sentiment Score: {hybrid['news_sentiment']:+.2f}")
+                out(f"    Confidence: {hybrid['news_confidence']:.2f}")
+                out(f"    Impact: {hybrid['news_impact']:.1f}/10")
+                out(f"    Summary: {hybrid['news_summary']}")
         else:
-            print(f"✗ Forecast failed: {response.status_code}")
-            print(f"  Error: {response.text}")
-            return False
+            out(f"\n  ℹ️  Hybrid mode enabled but no news sentiment available")
+        
+        out(f"\n  📝 Explanation:")
+        for part in data['explanation']:
+            out(f"    - {part}")
+        
+        out(f"\n  💡 Action Hint:")
+        out(f"    {data['action_hint']}")
+        
+        return True
+    else:
+        out(f"✗ Forecast failed: {response.status_code}")
+        out(f"  Error: {response.text}")
+        return False
 
 
-async def test_comparison():
+async def test_comparison(client: httpx.AsyncClient):
     """Compare ML-only vs Hybrid forecasts side-by-side."""
-    print("\n" + "="*60)
-    print("TEST 4: ML vs Hybrid Comparison")
-    print("="*60)
+    out("\n" + "="*60)
+    out("TEST 4: ML vs Hybrid Comparison")
+    out("="*60)
     
-    headers = {"X-API-Key": API_KEY}
+    # Get ML-only and hybrid forecasts concurrently (independent requests)
+    ml_response, hybrid_response = await asyncio.gather(
+        client.get("/v1/forecast", params={"pair": "USDINR", "h": "4h", "use_hybrid": False}),
+        client.get("/v1/forecast", params={"pair": "USDINR", "h": "4h", "use_hybrid": True})
+    )
     
-    async with httpx.AsyncClient() as client:
-        # Get ML-only forecast
-        ml_response = await client.get(
-            f"{API_BASE_URL}/v1/forecast",
-            params={"pair": "USDINR", "h": "4h", "use_hybrid": False},
-            headers=headers,
-            timeout=10.0
-        )
+    if ml_response.status_code == 200 and hybrid_response.status_code == 200:
+        ml_data = ml_response.json()
+        hybrid_data = hybrid_response.json()
         
-        # Get hybrid forecast
-        hybrid_response = await client.get(
-            f"{API_BASE_URL}/v1/forecast",
-            params={"pair": "USDINR", "h": "4h", "use_hybrid": True},
-            headers=headers,
-            timeout=10.0
-        )
+        out(f"\n{'Metric':<25} {'ML-Only':<15} {'Hybrid':<15} {'Difference':<15}")
+        out("-" * 70)
         
-        if ml_response.status_code == 200 and hybrid_response.status_code == 200:
-            ml_data = ml_response.json()
-            hybrid_data = hybrid_response.json()
-            
-            print(f"\n{'Metric':<25} {'ML-Only':<15} {'Hybrid':<15} {'Difference':<15}")
-            print("-" * 70)
-            
-            ml_prob = ml_data['prob_up']
-            hybrid_prob = hybrid_data['prob_up']
-            print(f"{'Probability Up':<25} {ml_prob:<15.3f} {hybrid_prob:<15.3f} {hybrid_prob - ml_prob:+.3f}")
-            
-            ml_delta = ml_data['expected_delta_bps']
-            hybrid_delta = hybrid_data['expected_delta_bps']
-            print(f"{'Expected Delta (bps)':<25} {ml_delta:<15.2f} {hybrid_delta:<15.2f} {hybrid_delta - ml_delta:+.2f}")
-            
-            ml_rec = ml_data['recommendation']
-            hybrid_rec = hybrid_data['recommendation']
-            rec_change = "✓ Same" if ml_rec == hybrid_rec else "⚠️  Changed"
-            print(f"{'Recommendation':<25} {ml_rec:<15} {hybrid_rec:<15} {rec_change}")
-            
-            ml_dir = ml_data['direction']
-            hybrid_dir = hybrid_data['direction']
-            dir_change = "✓ Same" if ml_dir == hybrid_dir else "⚠️  Changed"
-            print(f"{'Direction':<25} {ml_dir:<15} {hybrid_dir:<15} {dir_change}")
-            
-            # Show news impact if available
-            if hybrid_data.get('hybrid', {}).get('enabled'):
-                hybrid_info = hybrid_data['hybrid']
-                print(f"\n📊 News Impact:")
-                print(f"  Fusion Weight (News): {hybrid_info['fusion_weights']['llm']:.0%}")
-                if hybrid_info.get('news_sentiment') is not None:
-                    print(f"  News Sentiment: {hybrid_info['news_sentiment']:+.2f}")
-                    print(f"  News Impact: {hybrid_info['news_impact']:.1f}/10")
-            
-            return True
-        else:
-            print(f"✗ Comparison failed")
-            return False
+        ml_prob = ml_data['prob_up']
+        hybrid_prob = hybrid_data['prob_up']
+        out(f"{'Probability Up':<25} {ml_prob:<15.3f} {hybrid_prob:<15.3f} {hybrid_prob - ml_prob:+.3f}")
+        
+        ml_delta = ml_data['expected_delta_bps']
+        hybrid_delta = hybrid_data['expected_delta_bps']
+        out(f"{'Expected Delta (bps)':<25} {ml_delta:<15.2f} {hybrid_delta:<15.2f} {hybrid_delta - ml_delta:+.2f}")
+        
+        ml_rec = ml_data['recommendation']
+        hybrid_rec = hybrid_data['recommendation']
+        rec_change = "✓ Same" if ml_rec == hybrid_rec else "⚠️  Changed"
+        out(f"{'Recommendation':<25} {ml_rec:<15} {hybrid_rec:<15} {rec_change}")
+        
+        ml_dir = ml_data['direction']
+        hybrid_dir = hybrid_data['direction']
+        dir_change = "✓ Same" if ml_dir == hybrid_dir else "⚠️  Changed"
+        out(f"{'Direction':<25} {ml_dir:<15} {hybrid_dir:<15} {dir_change}")
+        
+        # Show news impact if available
+        if hybrid_data.get('hybrid', {}).get('enabled'):
+            hybrid_info = hybrid_data['hybrid']
+            out(f"\n📊 News Impact:")
+            out(f"  Fusion Weight (News): {hybrid_info['fusion_weights']['llm']:.0%}")
+            if hybrid_info.get('news_sentiment') is not None:
+                out(f"  News Sentiment: {hybrid_info['news_sentiment']:+.2f}")
+                out(f"  News Impact: {hybrid_info['news_impact']:.1f}/10")
+        
+        return True
+    else:
+        out(f"✗ Comparison failed")
+        return False
 
 
-async def test_different_pairs():
+async def test_different_pairs(client: httpx.AsyncClient):
     """Test hybrid forecast for multiple currency pairs."""
-    print("\n" + "="*60)
-    print("TEST 5: Multiple Currency Pairs")
-    print("="*60)
+    out("\n" + "="*60)
+    out("TEST 5: Multiple Currency Pairs")
+    out("="*60)
     
     pairs = ["USDINR", "EURUSD", "GBPUSD"]
-    headers = {"X-API-Key": API_KEY}
     
     results = []
+    sem = asyncio.Semaphore(5)
+    
+    async def fetch(pair):
+        async with sem:
+            return await client.get(
+                "/v1/forecast",
+                params={"pair": pair, "h": "4h", "use_hybrid": True}
+            )
     
-    async with httpx.AsyncClient() as client:
-        for pair in pairs:
-            try:
-                response = await client.get(
-                    f"{API_BASE_URL}/v1/forecast",
-                    params={"pair": pair, "h": "4h", "use_hybrid": True},
-                    headers=headers,
-                    timeout=10.0
-                )
+    # Request all pairs concurrently within a latency budget (6s per pair, 8s overall);
+    # anything slower is cancelled and reported as timed out
+    tasks = [asyncio.create_task(asyncio.wait_for(fetch(p), timeout=6.0)) for p in pairs]
+    done, pending = await asyncio.wait(tasks, timeout=8.0)
+    for t in pending:
+        t.cancel()
+    responses = [
+        TimeoutError() if t in pending else (t.exception() or t.result())
+        for t in tasks
+    ]
+    
+    for pair, response in zip(pairs, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            
+            if response.status_code == 200:
+                data = response.json()
+                hybrid_enabled = data.get('hybrid', {}).get('enabled', False)
+                has_news = data.get('hybrid', {}).get('news_sentiment') is not None
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    hybrid_enabled = data.get('hybrid', {}).get('enabled', False)
-                    has_news = data.get('hybrid', {}).get('news_sentiment') is not None
-                    
-                    print(f"\n  {pair}:")
-                    print(f"    Prob Up: {data['prob_up']:.3f}")
-                    print(f"    Delta: {data['expected_delta_bps']:+.2f} bps")
-                    print(f"    Recommendation: {data['recommendation']}")
-                    print(f"    Hybrid: {'✓ Active' if has_news else '○ No news'}")
-                    
-                    results.append(True)
-                else:
-                    print(f"\n  {pair}: ✗ Failed ({response.status_code})")
-                    results.append(False)
-            except Exception as e:
-                print(f"\n  {pair}: ✗ Error - {e}")
+                out(f"\n  {pair}:")
+                out(f"    Prob Up: {data['prob_up']:.3f}")
+                out(f"    Delta: {data['expected_delta_bps']:+.2f} bps")
+                out(f"    Recommendation: {data['recommendation']}")
+                out(f"    Hybrid: {'✓ Active' if has_news else '○ No news'}")
+                
+                results.append(True)
+            else:
+                out(f"\n  {pair}: ✗ Failed ({response.status_code})")
                 results.append(False)
-    
+        except TimeoutError:
+            out(f"\n  {pair}: ✗ Timed out")
+            results.append(False)
+        except Exception as e:
+            out(f"\n  {pair}: ✗ Error - {e}")
+            results.append(False)
+
     return all(results)
 
 
@@ -259,20 +296,38 @@ async def main():
     
     results = {}
     
-    # Test 1: Health check
-    results["Health Check"] = await test_health()
-    
-    # Test 2: ML-only forecast
-    results["ML-Only Forecast"] = await test_ml_only_forecast()
-    
-    # Test 3: Hybrid forecast
-    results["Hybrid Forecast"] = await test_hybrid_forecast()
-    
-    # Test 4: Comparison
-    results["ML vs Hybrid Comparison"] = await test_comparison()
+    # Resolve DNS once up front, so concurrent tests don't each hit the resolver
+    base_url, host_header = resolve_base_url(API_BASE_URL)
+    headers = {"X-API-Key": API_KEY}
+    if host_header:
+        headers["Host"] = host_header
     
-    # Test 5: Multiple pairs
-    results["Multiple Pairs"] = await test_different_pairs()
+    # One client for the whole suite, so every test reuses its keep-alive connections
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=httpx.Timeout(10.0),
+        http2=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0)
+    ) as client:
+        # Test 1: Health check
+        results["Health Check"] = await test_health(client)
+        
+        # Tests 2-5 are independent: run them concurrently once the API is up, with
+        # each test's output buffered and printed as one block, in test order
+        tests = {
+            "ML-Only Forecast": test_ml_only_forecast,
+            "Hybrid Forecast": test_hybrid_forecast,
+            "ML vs Hybrid Comparison": test_comparison,
+            "Multiple Pairs": test_different_pairs,
+        }
+        if results["Health Check"]:
+            outcomes = await asyncio.gather(*(run_buffered(t, client) for t in tests.values()))
+            for name, (passed, lines) in zip(tests, outcomes):
+                print("\n".join(lines))
+                results[name] = passed
+        else:
+            results.update(dict.fromkeys(tests, False))
     
     # Summary
     print("\n" + "="*60)
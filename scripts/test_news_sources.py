@@ -5,9 +5,81 @@ Test news sources to diagnose issues.
 import sys
 sys.path.insert(0, '.')
 
+import gzip
+import time
 import asyncio
-import feedparser
-from apps.news.sources import RSS_SOURCES
+import hashlib
+from pathlib import Path
+import io
+import httpx
+from lxml import etree
+from apps.news.sources import DEFAULT_RSS_FEEDS as RSS_SOURCES
+
+# Feed bodies are cached on disk briefly so repeated diagnostic runs skip the network
+CACHE_DIR = Path("/tmp/fxai_rss_cache")
+CACHE_TTL_SEC = 300
+
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+RSS1 = "{http://purl.org/rss/1.0/}"  # RSS 1.0 / RDF
+DC = "{http://purl.org/dc/elements/1.1/}"
+
+ENTRY_TAGS = ("item", f"{RSS1}item", f"{ATOM}entry")
+TITLE_TAGS = ("title", f"{RSS1}title", f"{ATOM}title")
+DATE_TAGS = ("pubDate", f"{DC}date", f"{ATOM}published", f"{ATOM}updated")
+
+
+def _first_text(elem, tags):
+    for tag in tags:
+        text = elem.findtext(tag)
+        if text:
+            return text
+    return None
+
+
+def parse_feed(body: bytes):
+    """
+    Summarize an RSS 2.0/RSS 1.0/Atom feed: (entry count, first title, first date, errors).
+    
+    Streams entries through libxml2 and frees each one as it goes; only the first
+    entry's title/date are read, which is all this diagnostic prints. The parser
+    recovers from malformed XML; what it had to recover from is returned in `errors`.
+    """
+    count, title, date = 0, None, None
+    parser = etree.iterparse(io.BytesIO(body), tag=ENTRY_TAGS, recover=True)
+    for _, elem in parser:
+        if count == 0:
+            title = _first_text(elem, TITLE_TAGS)
+            date = _first_text(elem, DATE_TAGS)
+        count += 1
+        elem.clear()
+    errors = [f"line {e.line}: {e.message}" for e in parser.error_log]
+    return count, title, date, errors
+
+
+async def cached_fetch(client: httpx.AsyncClient, url: str):
+    """
+    Return (HTTP status, parsed feed) for `url`, reusing a copy fetched in the last
+    CACHE_TTL_SEC (status "cached"). Non-2xx responses raise and are never cached.
+    """
+    path = CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+    if path.exists() and time.time() - path.stat().st_mtime < CACHE_TTL_SEC:
+        return "cached", parse_feed(gzip.decompress(path.read_bytes()))
+    response = await client.get(url, timeout=10.0, follow_redirects=True)
+    response.raise_for_status()
+    data = response.content
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(gzip.compress(data))
+    return response.status_code, parse_feed(data)
+
+
+async def fetch_one(client: httpx.AsyncClient, url: str):
+    """Return (feed, None) on success or (None, error)."""
+    try:
+        return await cached_fetch(client, url), None
+    except Exception as e:
+        return None, e
+
 
 async def test_rss_sources():
     """Test all RSS sources."""
@@ -16,31 +88,34 @@ async def test_rss_sources():
     print("=" * 60)
     print()
     
-    for source_name, url in RSS_SOURCES.items():
+    # Fetch every feed concurrently, then report in order
+    async with httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=16)) as client:
+        results = await asyncio.gather(*(fetch_one(client, url) for url in RSS_SOURCES.values()))
+    
+    for (source_name, url), (feed, error) in zip(RSS_SOURCES.items(), results):
         print(f"Testing: {source_name}")
         print(f"URL: {url}")
         
         try:
-            feed = feedparser.parse(url)
+            if error is not None:
+                raise error
             
-            if feed.bozo:
-                print(f"  ⚠️  Feed has parsing issues: {feed.bozo_exception}")
+            status, (count, title, date, errors) = feed
+            print(f"  Status: {status}")
             
-            if hasattr(feed, 'status'):
-                print(f"  Status: {feed.status}")
+            if errors:
+                print(f"  ⚠️  Feed has parsing issues ({len(errors)}): {errors[0]}")
             
-            if hasattr(feed, 'entries'):
-                print(f"  ✓ Entries found: {len(feed.entries)}")
-                
-                if len(feed.entries) > 0:
-                    entry = feed.entries[0]
-                    print(f"  Latest: {entry.get('title', 'No title')[:80]}")
-                    print(f"  Date: {entry.get('published', 'No date')}")
-                else:
-                    print(f"  ⚠️  No entries in feed")
+            print(f"  ✓ Entries found: {count}")
+            
+            if count > 0:
+                print(f"  Latest: {(title or 'No title')[:80]}")
+                print(f"  Date: {date or 'No date'}")
             else:
-                print(f"  ✗ No entries attribute")
+                print(f"  ⚠️  No entries in feed")
                 
+        except httpx.HTTPStatusError as e:
+            print(f"  ✗ Status: {e.response.status_code} (feed unavailable)")
         except Exception as e:
             print(f"  ✗ Error: {e}")
         